@@ -26,13 +26,24 @@ __credits__ = 'Blink SEO'
 
 import os
 import csv
+import functools
 import logging
 
 pga_logger = logging.getLogger(__name__)
 
 
-with open(os.path.join(os.path.dirname(__file__), 'data', 'google_ads_location_ids.csv'), mode='r') as infile:
-    reader = csv.reader(infile)
-    LOCATION_ID_DICT = {rows[1]: rows[2] for rows in reader}
+@functools.lru_cache(maxsize=None)
+def location_id_dict() -> dict:
+    """Map of iso country code -> Google Ads location id, read from the bundled csv on first use."""
+    with open(os.path.join(os.path.dirname(__file__), 'data', 'google_ads_location_ids.csv'), mode='r') as infile:
+        reader = csv.reader(infile)
+        return {rows[1]: rows[2] for rows in reader}
+
+
+def __getattr__(name):
+    # LOCATION_ID_DICT is loaded lazily so importing the package does not read the csv
+    if name == 'LOCATION_ID_DICT':
+        return location_id_dict()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
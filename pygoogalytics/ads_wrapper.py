@@ -1,19 +1,75 @@
 import datetime
-import re
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
 
 from .utils import ads_reports_parsing
+from . import pga_logger
 from google.ads.googleads.client import GoogleAdsClient
 from google.ads.googleads.v15.services.types.google_ads_service import GoogleAdsRow
 
 import pandas as pd
 
+
+# One GoogleAdsService (and so one gRPC channel) per GoogleAdsClient, shared by every
+# AdsWrapper built from that client, e.g. one per customer_id.
+# client -> [service, number of open AdsWrappers using it]
+_SERVICE_POOL: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_SERVICE_POOL_LOCK = threading.Lock()
+
+
+def _shared_service(googleads_client: GoogleAdsClient):
+    with _SERVICE_POOL_LOCK:
+        entry = _SERVICE_POOL.get(googleads_client)
+        if entry is None:
+            entry = _SERVICE_POOL[googleads_client] = [
+                googleads_client.get_service("GoogleAdsService", version='v15'), 0]
+        entry[1] += 1
+    return entry[0]
+
+
+def _release_service(googleads_client: GoogleAdsClient, service) -> None:
+    """Release one AdsWrapper's use of the pooled service; the channel is closed when the last user releases it."""
+    with _SERVICE_POOL_LOCK:
+        entry = _SERVICE_POOL.get(googleads_client)
+        if entry is None or entry[0] is not service:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _SERVICE_POOL[googleads_client]
+    service.transport.close()
+
+
 class AdsWrapper:
+    __slots__ = ('client', 'service', 'customer_id', '_search_request_type', '_closed')
+
     def __init__(self,
                  googleads_client: GoogleAdsClient,
                  customer_id: str,):
         self.client = googleads_client
-        self.service = self.client.get_service("GoogleAdsService", version='v15')
+        self.service = _shared_service(self.client)
+        self._closed = False
         self.customer_id = customer_id
+        # get_type returns a message instance; keep its class so requests are built without a registry lookup
+        self._search_request_type = type(self.client.get_type("SearchGoogleAdsStreamRequest"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Release this wrapper's use of the shared service. Its channel is only closed once every wrapper sharing
+        it has been closed; wrappers created afterwards from the same client then open a new one.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        _release_service(self.client, self.service)
 
     def get_data(self,
                       resource: str,
@@ -34,14 +90,58 @@ class AdsWrapper:
             conditions=conditions,
             custom_condition_expr=custom_condition_expr,
             limit=limit,
-            _return_raw=_return_raw
+            _return_raw=_return_raw,
+            _print_query=_print_query
         )
         if _return_raw:
             return rows
         return ads_reports_parsing.tidy_column_names(
-            pd.DataFrame.from_records(rows)
+            ads_reports_parsing.columns_to_dataframe(rows)
         )
 
+    def get_data_many(self,
+                      requests: list[dict],
+                      max_workers: int = 8) -> list[pd.DataFrame]:
+        """
+        Run several `get_data` requests concurrently over the same client.
+        @param requests: list of keyword-argument dicts, each accepted by `get_data`
+        @param max_workers: maximum number of `search_stream` calls in flight at once
+        @returns: list of DataFrames in the same order as `requests`
+        """
+        if len(requests) == 0:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+            return list(executor.map(lambda _kwargs: self.get_data(**_kwargs), requests))
+
+    def iter_data(self,
+                  resource: str,
+                  date: datetime.date | str | tuple[datetime.date | str, datetime.date | str] | None,
+                  dimensions: list[str],
+                  metrics: list[str],
+                  conditions: list | None = None,
+                  custom_condition_expr: str | None = None,
+                  limit: int | None = None,
+                  _print_query: bool = False) -> Iterator[pd.DataFrame]:
+        """
+        Same arguments as `get_data`, but yields one DataFrame per `search_stream` batch as it arrives
+        instead of waiting for the whole report.
+        """
+        search_request, fields = self._build_search_request(
+            resource=resource,
+            date=date,
+            metrics=metrics,
+            dimensions=dimensions,
+            conditions=conditions,
+            custom_condition_expr=custom_condition_expr,
+            limit=limit,
+            _print_query=_print_query
+        )
+        for batch in self.service.search_stream(search_request):
+            yield ads_reports_parsing.tidy_column_names(
+                ads_reports_parsing.columns_to_dataframe(
+                    ads_reports_parsing.extract_google_ads_columns(batch.results, dimensions=fields)
+                )
+            )
 
     def _make_request(self,
                      resource: str,
@@ -52,11 +152,45 @@ class AdsWrapper:
                      custom_condition_expr: str | None = None,
                      limit: int | None = None,
                       _return_raw: bool = False,
-                      _print_query: bool = False) -> list[dict | GoogleAdsRow]:
+                      _print_query: bool = False) -> dict[str, list] | list[GoogleAdsRow]:
+
+        search_request, fields = self._build_search_request(
+            resource=resource,
+            date=date,
+            metrics=metrics,
+            dimensions=dimensions,
+            conditions=conditions,
+            custom_condition_expr=custom_condition_expr,
+            limit=limit,
+            _print_query=_print_query
+        )
+
+        stream = self.service.search_stream(search_request)
+        if _return_raw:
+            raw_rows = []
+            for batch in stream:
+                raw_rows.extend(batch.results)
+            return raw_rows
+        return ads_reports_parsing.extract_google_ads_columns(
+            (row for batch in stream for row in batch.results), dimensions=fields
+        )
+
+    def _build_search_request(self,
+                              resource: str,
+                              date: datetime.date | str | tuple[datetime.date | str, datetime.date | str] | None,
+                              dimensions: list[str],
+                              metrics: list[str] = None,
+                              conditions: list | None = None,
+                              custom_condition_expr: str | None = None,
+                              limit: int | None = None,
+                              _print_query: bool = False):
+        """returns the SearchGoogleAdsStreamRequest and the list of selected fields"""
 
         if metrics is None:
             metrics = []
-        metrics = [f"metrics.{m}" if not re.match(r'metrics\.', m) else m for m in metrics]
+        metrics = list(ads_reports_parsing.normalise_metrics(tuple(metrics)))
+        fields = dimensions + metrics
+        ads_reports_parsing.validate_field_names(fields)
 
         if conditions is None:
             conditions = []
@@ -64,32 +198,18 @@ class AdsWrapper:
             _dc = ads_reports_parsing.make_date_condition(dt=date)
             conditions = [_dc] + conditions
 
-        search_request = self.client.get_type("SearchGoogleAdsStreamRequest")
+        search_request = self._search_request_type()
         search_request.customer_id = self.customer_id
         q = ads_reports_parsing.create_google_ads_sql_query(
             resource=resource,
-            dimensions=dimensions + metrics,
+            dimensions=fields,
             conditions=conditions,
             custom_condition_expr=custom_condition_expr,
             limit=limit
         )
+        pga_logger.debug("%s._build_search_request() :: query: %s", self.__class__.__name__, q)
         if _print_query:
             print(q)
-        search_request.query = re.sub(r'\n', '', q)
-
-        stream = self.service.search_stream(search_request)
-        raw_rows = []
-        for batch in stream:
-            raw_rows.extend([row for row in batch.results])
-        if _return_raw:
-            return raw_rows
-        return ads_reports_parsing.extract_google_ads_rows(
-            raw_rows, dimensions=dimensions + metrics
-        )
-
-
-
-
-
-
+        search_request.query = q
 
+        return search_request, fields
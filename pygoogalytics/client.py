@@ -1,14 +1,18 @@
-from typing import List
-
-from google.ads.googleads.client import GoogleAdsClient
+import json
+import time
+from collections import OrderedDict
+from typing import List, TYPE_CHECKING
 
 from pygoogalytics.utils.resource_utils import get_analytics_resources, \
     googleads_client_from_yaml, googleads_client_from_key_file, parse_ads_id, get_analytics_resources_oauth
 from .googalytics_wrapper import GoogalyticsWrapper
-from .kwp_wrappers import KeywordPlanIdeaService, KeywordPlanService
-from .ads_wrapper import AdsWrapper
 from . import pga_logger
 
+if TYPE_CHECKING:
+    # google-ads pulls in grpc and the full Ads proto catalogue, so the Ads modules are only
+    # imported when an AdsClient service is first requested
+    from google.ads.googleads.client import GoogleAdsClient
+
 
 class GoogalyticsClient:
     """
@@ -20,6 +24,13 @@ class GoogalyticsClient:
     googalytics_client = Client(key_file_path='<path-to-your-key-file>')
     """
 
+    __slots__ = ('gsc_resource', 'ga3_resource', 'ga4_resource', 'sc_domain', 'view_id', 'ga4_property_id',
+                 '_repr_cache', '_wrapper_cache')
+
+    # wrappers returned by `wrapper()` are reused for identical arguments
+    _WRAPPER_CACHE_TTL = 300
+    _WRAPPER_CACHE_SIZE = 32
+
     def __init__(self,
                  gsc_resource=None,
                  ga3_resource=None,
@@ -34,15 +45,24 @@ class GoogalyticsClient:
         self.view_id = None
         self.ga4_property_id = None
 
+        self._repr_cache = None
+        self._wrapper_cache: OrderedDict = OrderedDict()
+
     @classmethod
-    def build(cls, api_key: str | bytes | dict = None, key_file_path: str = None):
+    def build(cls, api_key: str | bytes | dict = None, key_file_path: str = None, lazy: bool = True):
+        """
+        @param lazy: if True, each resource is built on first use; if False, all three are built now, side by side
+        """
         _ga3_resource, _ga4_resource, _gsc_resource = get_analytics_resources(
-            json_api_key=api_key, key_file_path=key_file_path
+            json_api_key=api_key, key_file_path=key_file_path, lazy=lazy
         )
         return cls(gsc_resource=_gsc_resource, ga3_resource=_ga3_resource,  ga4_resource=_ga4_resource)
 
     @classmethod
-    def build_oauth(cls, config: str | bytes | dict, client_id: str, client_secret: str):
+    def build_oauth(cls, config: str | bytes | dict, client_id: str, client_secret: str, lazy: bool = True):
+        """
+        @param lazy: if True, each resource is built on first use; if False, all three are built now, side by side
+        """
         if isinstance(config, (bytes, str)):
             config = json.loads(config)
         if not isinstance(config, dict):
@@ -55,7 +75,7 @@ class GoogalyticsClient:
             raise ValueError("config must contain 'oauth' key")
 
         _ga3_resource, _ga4_resource, _gsc_resource = get_analytics_resources_oauth(
-            oauth_config=config.get("oauth"), client_id=client_id, client_secret=client_secret
+            oauth_config=config.get("oauth"), client_id=client_id, client_secret=client_secret, lazy=lazy
         )
 
         client = cls(gsc_resource=_gsc_resource, ga3_resource=_ga3_resource,  ga4_resource=_ga4_resource)
@@ -69,30 +89,57 @@ class GoogalyticsClient:
                 sc_domain: str = None,
                 view_id: str = None,
                 ga4_property_id: str = None,
+                response_cache=None,
+                cache_fallback: bool = False
                 ) -> GoogalyticsWrapper:
         """
         The GoogalyticsWrapper requires different arguments to access data depending on the source.
         @param sc_domain: required for GSC data. This is the url-like string you see in the Google Search Console web application when selecting the site. It is either a full url (e.g. `https://www.example.com/`) or something like `sc_domain:example.com`
         @param view_id: required for GA3 data: the "view_id" you see in "settings" on the GA web application. This is usually an 8- or 9-digit number, passed as a string
         @param ga4_property_id: required for GA4 data. Note that GA4 is currently not fully supported by PyGoogalytics
+        @param response_cache: optional directory path (or diskcache-like object) used to cache API responses
+        @param cache_fallback: if True (and response_cache is set), serve the last cached response, however old,
+        when the API is throttled or down
         @returns: GoogalyticsWrapper object.
         """
-        return GoogalyticsWrapper(
+        sc_domain = sc_domain or self.sc_domain
+        view_id = view_id or self.view_id
+        ga4_property_id = ga4_property_id or self.ga4_property_id
+
+        # a cache object (which may be unhashable) is keyed by identity; the cached wrapper holds a reference to
+        # it, so its id cannot be reused by another object while the entry exists
+        _cache_key = response_cache if response_cache is None or isinstance(response_cache, str) \
+            else ('id', id(response_cache))
+        _key = (sc_domain, view_id, ga4_property_id, _cache_key, cache_fallback)
+        _now = time.monotonic()
+        _cached = self._wrapper_cache.get(_key)
+        if _cached is not None and _now - _cached[0] < self._WRAPPER_CACHE_TTL \
+                and _cached[1].gsc_resource is self.gsc_resource \
+                and _cached[1].ga3_resource is self.ga3_resource \
+                and _cached[1].ga4_resource is self.ga4_resource:
+            self._wrapper_cache.move_to_end(_key)
+            return _cached[1]
+
+        _wrapper = GoogalyticsWrapper(
             gsc_resource=self.gsc_resource,
             ga3_resource=self.ga3_resource,
             ga4_resource=self.ga4_resource,
-            sc_domain=sc_domain or self.sc_domain,
-            view_id=view_id or self.view_id,
-            ga4_property_id=ga4_property_id or self.ga4_property_id
+            sc_domain=sc_domain,
+            view_id=view_id,
+            ga4_property_id=ga4_property_id,
+            response_cache=response_cache,
+            cache_fallback=cache_fallback
         )
+        self._wrapper_cache[_key] = (_now, _wrapper)
+        self._wrapper_cache.move_to_end(_key)
+        while len(self._wrapper_cache) > self._WRAPPER_CACHE_SIZE:
+            self._wrapper_cache.popitem(last=False)
+        return _wrapper
 
     def __bool__(self):
-        if self.gsc_resource is not None or self.ga3_resource is not None or self.ga4_resource is not None:
-            return True
-        else:
-            return False
+        return self.gsc_resource is not None or self.ga3_resource is not None or self.ga4_resource is not None
 
-    def __dict__(self):
+    def to_dict(self) -> dict:
         return {
             'gsc_resource': self.gsc_resource.__repr__(),
             'ga3_resource': self.ga3_resource.__repr__(),
@@ -100,29 +147,36 @@ class GoogalyticsClient:
         }
 
     def __repr__(self):
-        _s = 'PyGoogalytics Client object:\n'
-        for _k, _v in self.__dict__().items():
-            _s += f" - {_k}: {_v}\n"
-        return _s
+        # The cached string is keyed on which resource objects are held and whether lazy ones have been built,
+        # so reassigning a resource or building a LazyResource produces a fresh repr.
+        _key = tuple((id(_r), getattr(_r, 'is_built', True))
+                     for _r in (self.gsc_resource, self.ga3_resource, self.ga4_resource))
+        if self._repr_cache is None or self._repr_cache[0] != _key:
+            _repr = 'PyGoogalytics Client object:\n' + ''.join(f" - {_k}: {_v}\n" for _k, _v in self.to_dict().items())
+            self._repr_cache = (_key, _repr)
+        return self._repr_cache[1]
 
 
 class AdsClient:
+    __slots__ = ('googleads_client', 'default_customer_id', 'googleads_yaml_dict')
+
     def __init__(self,
-                 googleads_client: GoogleAdsClient,
+                 googleads_client: 'GoogleAdsClient',
                  default_customer_id: str = None,
                  googleads_yaml_dict: dict = None):
         self.googleads_client = googleads_client
-        self.default_customer_id = default_customer_id
+        # parsed once here so the services don't re-parse the default id on every call
+        self.default_customer_id = parse_ads_id(default_customer_id) if default_customer_id else None
         self.googleads_yaml_dict = googleads_yaml_dict
 
     @classmethod
     def build(cls, yaml_key: str = None, key_file_path: str = None):
         if yaml_key:
             googleads_client, default_customer_id, googleads_yaml_dict = googleads_client_from_yaml(googleads_yaml_string=yaml_key)
-            pga_logger.info(f"initialised KwpClient object from yaml string")
+            pga_logger.info("initialised AdsClient object from yaml string")
         elif key_file_path:
             googleads_client, default_customer_id, googleads_yaml_dict = googleads_client_from_key_file(path=key_file_path)
-            pga_logger.info(f"initialised KwpClient object from key file")
+            pga_logger.info("initialised AdsClient object from key file")
         else:
             raise KeyError("either yaml_key or key_file_path must be supplied")
 
@@ -131,21 +185,34 @@ class AdsClient:
                    googleads_yaml_dict=googleads_yaml_dict)
 
     def __bool__(self):
-        if self.googleads_client is not None:
-            return True
-        else:
-            return False
+        return self.googleads_client is not None
+
+    @property
+    def developer_token(self) -> str | None:
+        return (self.googleads_yaml_dict or {}).get('developer_token')
+
+    @property
+    def login_customer_id(self) -> str | None:
+        _login_customer_id = (self.googleads_yaml_dict or {}).get('login_customer_id')
+        return parse_ads_id(_login_customer_id) if _login_customer_id else None
+
+    def _resolve_customer_id(self, customer_id: str | int | None) -> str:
+        if customer_id is None:
+            if not self.default_customer_id:
+                raise ValueError("customer_id required: no default_customer_id is set on this AdsClient")
+            return self.default_customer_id
+        return parse_ads_id(customer_id)
 
     def plan_service(self,
                      customer_id: str = None,
                      location_codes: List[str] = None,
                      language_id: str = None
                      ):
-        if customer_id is None:
-            customer_id = self.default_customer_id
+        customer_id = self._resolve_customer_id(customer_id)
 
+        from .kwp_wrappers import KeywordPlanService
         return KeywordPlanService(googleads_client=self.googleads_client,
-                                  customer_id=parse_ads_id(customer_id),
+                                  customer_id=customer_id,
                                   location_codes=location_codes,
                                   language_id=language_id)
 
@@ -155,19 +222,19 @@ class AdsClient:
                       location_codes: List[str] = None,
                       language_id: str = None
                       ):
-        if customer_id is None:
-            customer_id = self.default_customer_id
+        customer_id = self._resolve_customer_id(customer_id)
 
+        from .kwp_wrappers import KeywordPlanIdeaService
         return KeywordPlanIdeaService(googleads_client=self.googleads_client,
-                                      customer_id=parse_ads_id(customer_id),
+                                      customer_id=customer_id,
                                       site_url=site_url,
                                       location_codes=location_codes,
                                       language_id=language_id)
 
-    def report_service(self, customer_id: str):
-        if customer_id is None:
-            customer_id = self.default_customer_id
+    def report_service(self, customer_id: str = None):
+        customer_id = self._resolve_customer_id(customer_id)
+        from .ads_wrapper import AdsWrapper
         return AdsWrapper(googleads_client=self.googleads_client,
-                          customer_id=parse_ads_id(customer_id))
+                          customer_id=customer_id)
 
 
@@ -1,20 +1,176 @@
 import pandas as pd
 import logging
-import re
 import datetime
-import json
-from typing import List, Union, Optional, Any
+import functools
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict
+from typing import List, Tuple, Union, Optional, Any
 
 from googleapiclient.errors import HttpError as GoogleApiHttpError
-from google.api_core.exceptions import ResourceExhausted, InvalidArgument, PermissionDenied
+from google.api_core.exceptions import ResourceExhausted, InvalidArgument, PermissionDenied, \
+    ServiceUnavailable, InternalServerError, DeadlineExceeded
 import google.analytics.data_v1beta.types as ga_data_types
 
 from . import googlepandas as gpd
 from .utils import general_utils
 from .utils.ga4_parser import parse_ga4_response, parse_ga3_response, join_ga4_responses
+from .utils.response_cache import open_response_cache, response_cache_key, response_cache_ttl
+from .utils.resource_utils import thread_http
 from . import pga_logger
 
 
+# Background refreshes for stale-while-revalidate properties; threads are only started on first use.
+_REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='pygoogalytics-refresh')
+
+# Cap on concurrent Google API requests across all wrappers in the process, so fanning out
+# (get_all, available_dates, background refreshes) does not burst past the per-project concurrency quotas.
+MAX_CONCURRENT_REQUESTS = 10
+_API_SEMAPHORE = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Retries for throttled requests (ResourceExhausted, HTTP 429, rate limit or quota errors):
+# wait min(RETRY_MAX_WAIT, RETRY_BASE * 2**(retry - 1)) seconds plus up to RETRY_JITTER seconds of random jitter.
+RETRY_ATTEMPTS = 5
+RETRY_BASE = 0.5
+RETRY_MAX_WAIT = 30
+RETRY_JITTER = 0.5
+# While rate limited, retries go through this lock so only one request at a time probes the API.
+_RATE_LIMIT_LOCK = threading.Lock()
+
+# Attempts for a GA4 report page that fails with an error outside GA4_FATAL_ERRORS
+GA4_PAGE_ATTEMPTS = 3
+
+# Number of GSC pages (of 25,000 rows) requested at once after the first page comes back full
+GSC_PAGE_WAVE = 4
+
+# In-process memo in front of the response cache: number of responses kept per wrapper, and their maximum age in
+# seconds (shorter than the response cache TTL, as the memo cannot see when a disk entry was written)
+MEMO_SIZE = 128
+MEMO_MAX_AGE = 300
+
+# get_df dispatch: result -> (kind of request, response_type or fixed gsc_dimensions)
+RESULT_DISPATCH = {
+    'GA4': ('analytics', 'GA4'),
+    'GA3': ('analytics', 'GA3'),
+    'GSC': ('gsc', None),
+    'GSCQ': ('gsc', ('query',)),
+    'URL': ('url', None),
+}
+
+
+def _result_dispatch(result: str) -> tuple:
+    # any other result starting with GA3, GA4 or GSC is dispatched on that prefix
+    _dispatch = RESULT_DISPATCH.get(result)
+    if _dispatch is None and result[:3] in ('GA3', 'GA4', 'GSC'):
+        _dispatch = RESULT_DISPATCH[result[:3]]
+    return _dispatch or (None, None)
+
+
+# Columns of the URL inspection dataframe, in the order of the keys set by urlinspection_dict
+URL_INSPECTION_COLUMNS = ('record_date', 'record_time', 'url', 'response', 'index_status_result_verdict',
+                          'coverage_state', 'robotstxt_state', 'indexing_state', 'last_crawl_time',
+                          'page_fetch_state', 'google_canonical', 'user_canonical', 'sitemap', 'referring_urls',
+                          'crawled_as', 'mobile_usability_result_verdict')
+URL_INSPECTION_CATEGORY_COLUMNS = ('response', 'index_status_result_verdict', 'coverage_state', 'robotstxt_state',
+                                   'indexing_state', 'page_fetch_state', 'crawled_as',
+                                   'mobile_usability_result_verdict')
+
+# Worker threads shared by all wrappers for concurrent requests (get_all, GA4 pages, api tests, available dates).
+# Long-lived workers keep their per-thread authorised Http (see thread_http), so connections are reused across
+# calls and across wrappers built from the same credentials.
+PGA_WORKERS = int(os.getenv('PGA_WORKERS', 16))
+_DEFAULT_EXECUTOR = ThreadPoolExecutor(max_workers=PGA_WORKERS, thread_name_prefix='pygoogalytics')
+
+
+def _freeze(obj):
+    """Hashable equivalent of a request made of dicts, lists and scalars, used as an in-process memo key."""
+    if isinstance(obj, dict):
+        return tuple(sorted((_k, _freeze(_v)) for _k, _v in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(_v) for _v in obj)
+    return obj
+
+
+def _run_or_wait(call, future: Future):
+    """
+    The result of `call`, submitted to an executor as `future`: run it in this thread if no worker has started
+    it yet (so a thread waiting on the executor never blocks on a queued task), otherwise wait for the worker.
+    """
+    return call() if future.cancel() else future.result()
+
+
+@functools.lru_cache(maxsize=64)
+def _ga4_dimensions(names: tuple) -> tuple:
+    """GA4 Dimension messages for `names`, built once per distinct tuple of names (never mutate them)."""
+    return tuple(ga_data_types.Dimension(name=_) for _ in names)
+
+
+@functools.lru_cache(maxsize=64)
+def _ga4_metrics(names: tuple) -> tuple:
+    """GA4 Metric messages for `names`, built once per distinct tuple of names (never mutate them)."""
+    return tuple(ga_data_types.Metric(name=_) for _ in names)
+
+
+def _to_date(value):
+    """
+    Convert a date string ('YYYY-MM-DD', or 'YYYYMMDD' / 'YYYY MM DD' as accepted by `general_utils.parse_date`)
+    to a date; dates, None and anything else are returned unchanged.
+    """
+    if isinstance(value, str):
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            return general_utils.parse_date(value)
+    return value
+
+
+def _is_transient(error: Exception) -> bool:
+    """True if `error` is a throttling error that is worth retrying after a wait."""
+    if isinstance(error, ResourceExhausted):
+        return True
+    if isinstance(error, GoogleApiHttpError) and getattr(error.resp, 'status', None) == 429:
+        return True
+    _message = repr(error).lower()
+    return 'rate limit' in _message or 'quota' in _message
+
+
+def _is_outage(error: Exception) -> bool:
+    """True for throttling and server-side errors, when a stale cached response is better than none."""
+    if _is_transient(error) or isinstance(error, (ServiceUnavailable, InternalServerError, DeadlineExceeded)):
+        return True
+    return isinstance(error, GoogleApiHttpError) and (getattr(error.resp, 'status', None) or 0) >= 500
+
+
+def _call_api(fetch):
+    """
+    Call `fetch()` within the process-wide concurrency limit, retrying throttling errors with exponential backoff
+    and jitter. Other errors, and the last throttling error after RETRY_ATTEMPTS attempts, are raised.
+    """
+    with _API_SEMAPHORE:
+        try:
+            return fetch()
+        except Exception as _e:
+            if not _is_transient(_e):
+                raise
+            _error = _e
+
+    for _attempt in range(1, RETRY_ATTEMPTS):
+        _wait = min(RETRY_MAX_WAIT, RETRY_BASE * 2 ** (_attempt - 1)) + random.uniform(0, RETRY_JITTER)
+        pga_logger.debug("rate limited (%r), retrying in %.1fs", _error, _wait)
+        time.sleep(_wait)
+        with _RATE_LIMIT_LOCK, _API_SEMAPHORE:
+            try:
+                return fetch()
+            except Exception as _e:
+                if not _is_transient(_e):
+                    raise
+                _error = _e
+    raise _error
+
+
 class MissingID(AttributeError):
     """Error raised when Property ID is not specified"""
     def __init__(self, message="Missing ID"):
@@ -22,6 +178,24 @@ class MissingID(AttributeError):
         super().__init__(self.message)
 
 
+# GA4 errors that retrying will not fix (ResourceExhausted has already been retried by _call_api)
+GA4_FATAL_ERRORS = (PermissionDenied, ResourceExhausted, MissingID, InvalidArgument)
+
+
+def _ga4_error_type(error: Exception) -> str:
+    """error_type reported in GA4 response dictionaries for an error in GA4_FATAL_ERRORS."""
+    if isinstance(error, InvalidArgument):
+        if "metrics are incompatible" in error.message:
+            return 'IncompatibleMetrics'
+        if "Invalid property ID" in error.message:
+            return 'InvalidPropertyID'
+        return 'InvalidArgument'
+    for _error_class in (PermissionDenied, ResourceExhausted, MissingID):
+        if isinstance(error, _error_class):
+            return _error_class.__name__
+    return "Error"
+
+
 class GoogalyticsWrapper:
     """
     The GoogalyticsWrapper requires the following arguments to access data:
@@ -29,39 +203,96 @@ class GoogalyticsWrapper:
     when selecting the site. It is either a full url (e.g. `https://www.example.com/`) or something like `sc_domain:example.com`
     - for GA3 data: the "view_id" you see in "settings" on the GA web application. This is usually an 8- or 9-digit number, passed as a string
     - for GA4 data: the ga4 property id.
+
+    Optionally, `response_cache` (a directory path for a diskcache.Cache, or any object with diskcache-style
+    `get`/`set(..., expire=...)` methods) caches raw API responses so identical requests skip the network,
+    With `cache_fallback=True`, throttling or server errors return the last cached response for the request
+    (however old) with 'stale': True and 'stale_error' added, instead of failing.
+    `executor` replaces the module-wide thread pool (PGA_WORKERS threads) used for concurrent requests.
     """
+
+    # (soft, hard) ages in seconds for the stale-while-revalidate properties: past the soft age the cached
+    # value is returned while a refresh runs in the background, past the hard age the caller waits for a refresh
+    API_TEST_TTL = (3600, 6 * 3600)
+    AVAILABLE_DATES_TTL = (900, 3600)
+
     def __init__(self,
                  gsc_resource,
                  ga3_resource,
                  ga4_resource,
                  sc_domain: str = None,
                  view_id: str = None,
-                 ga4_property_id: str = None):
+                 ga4_property_id: str = None,
+                 response_cache=None,
+                 executor: ThreadPoolExecutor = None,
+                 cache_fallback: bool = False):
 
         self.sc_domain: str = sc_domain
         self.view_id: str = view_id
         self.ga4_property_id: str = ga4_property_id
 
-        self._api_test_gsc: dict = dict()
-        self._api_test_ga3: dict = dict()
-        self._api_test_ga4: dict = dict()
+        # name -> (time.monotonic() when computed, value, _swr_ids() when computed)
+        self._swr_values: dict = dict()
+        self._swr_locks: dict = {_name: threading.Lock()
+                                 for _name in ('api_test_gsc', 'api_test_ga3', 'api_test_ga4', 'available_dates')}
 
         self.gsc_resource = gsc_resource
         self.ga3_resource = ga3_resource
         self.ga4_resource = ga4_resource
 
-        pga_logger.debug(f"initialising GoogalyticsWrapper object")
+        self.response_cache = open_response_cache(response_cache)
+        self._executor = executor if executor is not None else _DEFAULT_EXECUTOR
+        # keep a non-expiring copy of each cached response, served (flagged 'stale') when the API is unavailable
+        self.cache_fallback: bool = cache_fallback
+
+        # response cache key -> Future of the API call currently fetching it, shared by concurrent identical requests
+        self._inflight: dict[str, Future] = dict()
+        self._inflight_lock = threading.Lock()
+        # (endpoint, frozen request) -> (time.monotonic() expiry, response), only used with a response cache
+        self._memo: OrderedDict = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+        pga_logger.debug("initialising GoogalyticsWrapper object")
 
     # *****************************************************************
     # *** GAPI_WRAPPER STATS ******************************************
 
-    def __dict__(self) -> dict:
-        _dates_test = self.available_dates
-        gsc_date_range_str = general_utils.date_range_string(dates=_dates_test.get("GSC"),
-                                                     alternate_text="No dates available from GSC")
-        ga3_date_range_str = general_utils.date_range_string(dates=_dates_test.get("GA3"),
-                                                     alternate_text="No dates available from GA3")
+    def _gather_list(self, calls: list) -> list:
+        """
+        Run independent zero-argument callables on the wrapper's executor and return their results in order.
+        Calls are collected with `_run_or_wait`, so nested fan-outs cannot deadlock a busy executor.
+        """
+        _futures = [self._executor.submit(_call) for _call in calls]
+        return [_run_or_wait(_call, _future) for _call, _future in zip(calls, _futures)]
+
+    def _gather(self, **calls) -> dict:
+        """Run independent zero-argument callables concurrently and return their results by keyword."""
+        return dict(zip(calls.keys(), self._gather_list(list(calls.values()))))
+
+    def to_dict(self, include_live: bool = False) -> dict:
+        """
+        Summary of the wrapper's configuration, API status and available dates.
+        @param include_live: if True, run (or refresh) the API tests and date checks, which makes several API
+        calls; otherwise only report results that have already been computed, and None for the rest
+        """
+        if include_live:
+            _dates_test = self.available_dates
+            # the GSC and GA3 tests use different resources, so they can run side by side
+            _tests = self._gather(gsc=lambda: self.api_test_gsc, ga3=lambda: self.api_test_ga3)
+        else:
+            _dates_test = self._swr_cached('available_dates')
+            _tests = {'gsc': self._swr_cached('api_test_gsc'), 'ga3': self._swr_cached('api_test_ga3')}
+
+        if _dates_test is None:
+            gsc_date_range_str = ga3_date_range_str = None
+        else:
+            gsc_date_range_str = general_utils.date_range_string(dates=_dates_test.get("GSC"),
+                                                                 alternate_text="No dates available from GSC")
+            ga3_date_range_str = general_utils.date_range_string(dates=_dates_test.get("GA3"),
+                                                                 alternate_text="No dates available from GA3")
 
+        _gsc_test = _tests['gsc'] or {}
+        _ga3_test = _tests['ga3'] or {}
         return {
             "API config": {
                 "GSC sc-domain": self.sc_domain,
@@ -69,10 +300,12 @@ class GoogalyticsWrapper:
                 "GA4 Property ID": self.ga4_property_id
             },
             "API status": {
-                "GSC status": self.api_test_gsc.get('status'),
-                "GA3 status": self.api_test_ga3.get('status'),
-                "GSC error": self.api_test_gsc.get('error'),
-                "GA3 error": self.api_test_ga3.get('error')
+                "GSC status": _gsc_test.get('status'),
+                "GA3 status": _ga3_test.get('status'),
+                "GSC error": _gsc_test.get('error'),
+                "GA3 error": _ga3_test.get('error'),
+                "GSC tested at": _gsc_test.get('timestamp'),
+                "GA3 tested at": _ga3_test.get('timestamp')
             },
             "Available datas": {
                 "GSC": gsc_date_range_str,
@@ -82,26 +315,28 @@ class GoogalyticsWrapper:
 
     def __repr__(self):
         _s = "GoogalyticsWrapper object:\n"
-        _s += json.dumps(self.__dict__(), indent=2)
+        _s += general_utils.json_dumps(self.to_dict(include_live=False), indent=True)
         return _s
 
     @property
     def api_summary(self) -> dict:
         _dates_test = self.available_dates
+        _tests = self._gather(gsc=lambda: self.api_test_gsc, ga3=lambda: self.api_test_ga3)
         _sc_domain = ""
-        if re.match("sc-domain:.+", self.sc_domain):
+        if self.sc_domain and general_utils.RE_SC_DOMAIN.match(self.sc_domain):
             _sc_domain = self.sc_domain
         return {"GA3 view id": self.view_id,
                 "sc-domain": _sc_domain,
-                "GA3 API": self.api_test_ga3.get('status'),
-                "GSC API": self.api_test_gsc.get('status'),
+                "GA3 API": _tests['ga3'].get('status'),
+                "GSC API": _tests['gsc'].get('status'),
                 "GA3 dates": len(_dates_test.get("GA3")),
                 "GSC dates": len(_dates_test.get("GSC")),
                 }
 
     def _perform_api_test_gsc(self) -> dict:
         """test GSC API"""
-        pga_logger.debug(f"{self.__class__.__name__}.api_test() :: testing GSC api")
+        pga_logger.debug("%s.api_test() :: testing GSC api", self.__class__.__name__)
+        _now = datetime.datetime.now(datetime.timezone.utc)
 
         _api_error = None
         _dates_list = []
@@ -111,23 +346,22 @@ class GoogalyticsWrapper:
                 status="SC Domain not set",
                 error="SC Domain not set",
                 date_count=0,
-                timestamp=datetime.datetime.utcnow()
+                timestamp=_now
             )
 
         try:
-            _ = self.get_gsc_response(start_date=datetime.date.today() + datetime.timedelta(days=-7),
-                                      raise_http_error=True)
+            # a single dates query both checks access and counts the available dates
+            _dates_list = self.get_dates(result="GSC", raise_errors=True)
             _api_status = "Success"
-            pga_logger.debug(f"{self.__class__.__name__}.api_test() :: GSC api successful")
-            _dates_list = self.get_dates(result="GSC")
+            pga_logger.debug("%s.api_test() :: GSC api successful", self.__class__.__name__)
         except GoogleApiHttpError as http_e:
             _api_status = "HttpError"
             _api_error = http_e.reason.split('See also')[0]
-            pga_logger.debug(f"{self.__class__.__name__}.api_test() :: GSC api failed")
+            pga_logger.debug("%s.api_test() :: GSC api failed", self.__class__.__name__)
         except Exception as http_e:
             _api_status = "Other Error"
             _api_error = repr(http_e)
-            pga_logger.debug(f"{self.__class__.__name__}.api_test() :: GSC api failed")
+            pga_logger.debug("%s.api_test() :: GSC api failed", self.__class__.__name__)
             # The HttpError for GSC contains this unhelpful "See also this answer to a question..."
             # which is just a link to an FAQ with a 404 error
 
@@ -135,134 +369,236 @@ class GoogalyticsWrapper:
             status=_api_status,
             error=_api_error,
             date_count=len(_dates_list),
-            timestamp=datetime.datetime.utcnow()
+            timestamp=_now
         )
 
+    def _swr_ids(self) -> tuple:
+        # the stale-while-revalidate values depend on these, so a value computed for other IDs is discarded
+        return self.sc_domain, self.view_id, self.ga4_property_id
+
+    def _swr_entry(self, name: str):
+        _entry = self._swr_values.get(name)
+        if _entry is None or _entry[2] != self._swr_ids():
+            return None
+        return _entry
+
+    def _stale_while_revalidate(self, name: str, compute, ttl: tuple):
+        _soft_ttl, _hard_ttl = ttl
+        _entry = self._swr_entry(name)
+        if _entry is None or time.monotonic() - _entry[0] >= _hard_ttl:
+            _ids = self._swr_ids()
+            value = compute()
+            self._swr_values[name] = (time.monotonic(), value, _ids)
+            return value
+        if time.monotonic() - _entry[0] >= _soft_ttl:
+            self._refresh_in_background(name, compute)
+        return _entry[1]
+
+    def _swr_cached(self, name: str):
+        """The last computed value of a stale-while-revalidate property, or None; never calls the API."""
+        _entry = self._swr_entry(name)
+        return None if _entry is None else _entry[1]
+
+    def refresh(self):
+        """
+        Discard the cached API tests and available dates (and the in-process response memo), so that the next
+        access calls the API again.
+        """
+        self._swr_values.clear()
+        with self._memo_lock:
+            self._memo.clear()
+
+    def _refresh_in_background(self, name: str, compute):
+        _lock = self._swr_locks[name]
+        if not _lock.acquire(blocking=False):
+            return  # a refresh is already running
+
+        def _refresh():
+            try:
+                _ids = self._swr_ids()
+                self._swr_values[name] = (time.monotonic(), compute(), _ids)
+            except Exception as _e:
+                pga_logger.debug("%s.%s :: background refresh failed: %r", self.__class__.__name__, name, _e)
+            finally:
+                _lock.release()
+
+        _REFRESH_EXECUTOR.submit(_refresh)
+
     @property
     def api_test_gsc(self) -> dict:
-        if self._api_test_gsc.get('status') is None:
-            self._api_test_gsc = self._perform_api_test_gsc()
-        return self._api_test_gsc
+        return self._stale_while_revalidate('api_test_gsc', self._perform_api_test_gsc, self.API_TEST_TTL)
 
     @property
     def api_test_ga3(self) -> dict:
-        if self._api_test_ga3.get('status') is None or not general_utils.test_time(self._api_test_ga3.get('timestamp'), 3600):
-            self._api_test_ga3 = self._perform_api_test_ga3()
-        return self._api_test_ga3
+        return self._stale_while_revalidate('api_test_ga3', self._perform_api_test_ga3, self.API_TEST_TTL)
 
     def _perform_api_test_ga3(self) -> dict:
         """test GA API"""
-        pga_logger.debug(f"{self.__class__.__name__}.api_test() :: testing GA api")
+        pga_logger.debug("%s.api_test() :: testing GA api", self.__class__.__name__)
+        _now = datetime.datetime.now(datetime.timezone.utc)
         _api_error = None
         if not self.view_id:
             return dict(
                 status="No View ID",
                 error="GA3 View ID not set",
                 date_count=0,
-                timestamp=datetime.datetime.utcnow()
+                timestamp=_now
             )
 
         _dates_list = []
         try:
-            _date = datetime.date.today() + datetime.timedelta(days=-7)
-            _ = self.get_ga3_response(
-                start_date=_date,
-                end_date=_date,
-                dimensions=['date'],
-                metrics=['users'],
-                raise_http_error=True,
-                log_error=False
-            )
+            _dates_list = self.get_dates(result="GA3", raise_errors=True)
             _api_status = "Success"
-            pga_logger.debug(f"{self.__class__.__name__}.api_test() :: GA api successful")
-            _dates_list = self.get_dates(result="GA3")
+            pga_logger.debug("%s.api_test() :: GA api successful", self.__class__.__name__)
         except GoogleApiHttpError as http_e:
             _api_status = "HttpError"
             _api_error = repr(http_e)
-            pga_logger.debug(f"{self.__class__.__name__}.api_test() :: GA api failed")
+            pga_logger.debug("%s.api_test() :: GA api failed", self.__class__.__name__)
         except Exception as http_e:
             _api_status = "Other Error"
             _api_error = repr(http_e)
-            pga_logger.debug(f"{self.__class__.__name__}.api_test() :: GA api failed")
+            pga_logger.debug("%s.api_test() :: GA api failed", self.__class__.__name__)
         return dict(
             status=_api_status,
             error=_api_error,
             date_count=len(_dates_list),
-            timestamp=datetime.datetime.utcnow()
+            timestamp=_now
         )
 
     @property
     def api_test_ga4(self) -> dict:
-        if self._api_test_ga4.get('status') is None or not general_utils.test_time(self._api_test_ga4.get('timestamp'), 3600):
-            self._api_test_ga4 = self._perform_api_test_ga4()
-        return self._api_test_ga4
+        return self._stale_while_revalidate('api_test_ga4', self._perform_api_test_ga4, self.API_TEST_TTL)
 
     def _perform_api_test_ga4(self) -> dict:
         """test GA4 API"""
-        pga_logger.debug(f"{self.__class__.__name__}.api_test() :: testing GA4 api")
+        pga_logger.debug("%s.api_test() :: testing GA4 api", self.__class__.__name__)
+        _now = datetime.datetime.now(datetime.timezone.utc)
 
         if not self.ga4_property_id:
             return dict(
                 status="No property id",
                 error="Ga4 Property ID not set",
                 date_count=0,
-                timestamp=datetime.datetime.utcnow()
+                timestamp=_now
             )
 
         _dates_list = []
-        _error = None
+        _api_error = None
         try:
-            _date = datetime.date.today() + datetime.timedelta(days=-7)
-            _response = self.get_ga4_response(
-                start_date=_date,
-                end_date=_date,
-                dimensions=['date'],
-                metrics=['totalUsers']
-            )
-            _error = _response.get('error')
-            if _error:
-                _api_status = _response.get('error_type')
-                _api_error = str(_error)
-            else:
-                _api_status = "Success"
-                pga_logger.debug(f"{self.__class__.__name__}.api_test() :: GA4 api successful")
-                _dates_list = self.get_dates(result="GA4")
-                _api_error = None
-        except GoogleApiHttpError as http_e:
-            _api_status = "HttpError"
-            _api_error = repr(http_e)
-            pga_logger.debug(f"{self.__class__.__name__}.api_test() :: GA4 api failed")
-        except Exception as http_e:
-            _api_status = "Other Error"
-            _api_error = repr(http_e)
-            pga_logger.debug(f"{self.__class__.__name__}.api_test() :: GA4 api failed")
-
+            _dates_list = self.get_dates(result="GA4", raise_errors=True)
+            _api_status = "Success"
+            pga_logger.debug("%s.api_test() :: GA4 api successful", self.__class__.__name__)
+        except Exception as _e:
+            _api_status = _ga4_error_type(_e)
+            _api_error = str(_e)
+            pga_logger.debug("%s.api_test() :: GA4 api failed", self.__class__.__name__)
 
         return dict(
             status=_api_status,
             error=_api_error,
             date_count=len(_dates_list),
-            timestamp=datetime.datetime.utcnow()
+            timestamp=_now
         )
 
     # *****************************************************************************************
 
     @property
     def available_dates(self) -> dict:
-        gsc_date_list: List[datetime.date] = self.get_dates(result="GSC")
-        ga3_date_list: List[datetime.date] = self.get_dates(result="GA3")
-        ga4_date_list: List[datetime.date] = self.get_dates(result="GA4")
-        return {"GA3": ga3_date_list, "GA4": ga4_date_list, "GSC": gsc_date_list}
+        return self._stale_while_revalidate('available_dates', self._fetch_available_dates, self.AVAILABLE_DATES_TTL)
+
+    def _fetch_available_dates(self) -> dict:
+        # sources without a configured ID have no dates, and are not submitted to the executor at all
+        _results = [_result for _result in ("GA3", "GA4", "GSC") if self._source_id(_result)]
+        _dates = {_result: [] for _result in ("GA3", "GA4", "GSC")}
+        _dates.update(self._gather(**{_result: functools.partial(self.get_dates, result=_result)
+                                      for _result in _results}))
+        return _dates
 
     # *** Calls to Google API *****************************************************************
 
+    def _cached_call(self, endpoint: str, request: dict, end_date: datetime.date, fetch, dump=None, load=None):
+        """
+        Return the response for `request` from the in-process memo or the response cache, or call `fetch()`
+        (see `_call_api`) and cache its result. Concurrent calls for the same request share a single `fetch()`.
+        Exceptions raised by `fetch` propagate and nothing is cached, unless `_cache_fallback_response` has a
+        stale copy to return instead.
+        @param dump, load: optional converters applied to the response on the way into and out of the cache
+        """
+        if self.response_cache is not None:
+            _memo_key = (endpoint, _freeze(request))
+            _memo_ttl = min(MEMO_MAX_AGE, response_cache_ttl(endpoint, end_date))
+            with self._memo_lock:
+                _memo = self._memo.get(_memo_key)
+                if _memo is not None and _memo[0] > time.monotonic():
+                    self._memo.move_to_end(_memo_key)
+                    return _memo[1]
+
+        _key = response_cache_key(endpoint, request)
+        if self.response_cache is not None:
+            _cached = self.response_cache.get(_key)
+            if _cached is not None:
+                response = load(_cached) if load else _cached
+                self._memo_put(_memo_key, response, _memo_ttl)
+                return response
+
+        with self._inflight_lock:
+            _future = self._inflight.get(_key)
+            _owner = _future is None
+            if _owner:
+                _future = self._inflight[_key] = Future()
+        if not _owner:
+            return _future.result()
+
+        try:
+            try:
+                response = _call_api(fetch)
+            except Exception as _api_error:
+                response = self._cache_fallback_response(_key, _api_error, load)
+                if response is None:
+                    raise
+            else:
+                if self.response_cache is not None:
+                    _dumped = dump(response) if dump else response
+                    self.response_cache.set(_key, _dumped, expire=response_cache_ttl(endpoint, end_date))
+                    if self.cache_fallback:
+                        self.response_cache.set(_key + ':fallback', _dumped, expire=None)
+                    self._memo_put(_memo_key, response, _memo_ttl)
+            _future.set_result(response)
+        except BaseException as _e:
+            _future.set_exception(_e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[_key]
+        return response
+
+    def _memo_put(self, key: tuple, response, ttl: float):
+        with self._memo_lock:
+            self._memo[key] = (time.monotonic() + ttl, response)
+            self._memo.move_to_end(key)
+            while len(self._memo) > MEMO_SIZE:
+                self._memo.popitem(last=False)
+
+    def _cache_fallback_response(self, key: str, error: Exception, load=None) -> Optional[dict]:
+        """The last cached response for `key`, flagged as stale, if cache_fallback applies to `error`; else None."""
+        if not self.cache_fallback or self.response_cache is None or not _is_outage(error):
+            return None
+        _cached = self.response_cache.get(key + ':fallback')
+        if _cached is None:
+            return None
+        pga_logger.warning("%s :: serving stale cached response after %r", self.__class__.__name__, error)
+        return {**(load(_cached) if load else _cached), 'stale': True, 'stale_error': repr(error)}
+
     def get_inspection_response(self,
                                 inspection_url: str):
         gsc_request = {
             'siteUrl': self.sc_domain,
             'inspectionUrl': inspection_url,
         }
-        gsc_response = self.gsc_resource.urlInspection().index().inspect(body=gsc_request).execute()
+        gsc_response = _call_api(
+            lambda: self.gsc_resource.urlInspection().index().inspect(body=gsc_request).execute(
+                http=thread_http(self.gsc_resource))
+        )
         return gsc_response
 
     def get_gsc_response(self,
@@ -279,13 +615,11 @@ class GoogalyticsWrapper:
         if end_date is None:
             end_date = start_date
 
-        if isinstance(start_date, str):
-            start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-        if isinstance(end_date, str):
-            end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+        start_date = _to_date(start_date)
+        end_date = _to_date(end_date)
 
-        start_date_string = start_date.strftime("%Y-%m-%d")
-        end_date_string = end_date.strftime("%Y-%m-%d")
+        start_date_string = start_date.isoformat()
+        end_date_string = end_date.isoformat()
 
         if gsc_dimensions is None:
             gsc_dimensions = ['country', 'device', 'page', 'query']
@@ -307,12 +641,16 @@ class GoogalyticsWrapper:
         }
 
         try:
-            gsc_response = self.gsc_resource.searchanalytics().query(siteUrl=self.sc_domain,
-                                                                     body=gsc_request).execute()
+            gsc_response = self._cached_call(
+                'GSC', {'siteUrl': self.sc_domain, **gsc_request}, end_date,
+                lambda: self.gsc_resource.searchanalytics().query(siteUrl=self.sc_domain,
+                                                                  body=gsc_request).execute(
+                    http=thread_http(self.gsc_resource))
+            )
         except GoogleApiHttpError as http_error:
-            if re.match(".*user does not have sufficient permissions", repr(http_error).lower()):
+            if general_utils.RE_INSUFFICIENT_PERMISSIONS.search(repr(http_error).lower()):
                 pga_logger.error(
-                    f"{self.__class__.__name__}.get_gsc_response() :: user does not have sufficient permissions")
+                    "%s.get_gsc_response() :: user does not have sufficient permissions", self.__class__.__name__)
             if raise_http_error:
                 raise http_error
             else:
@@ -327,7 +665,7 @@ class GoogalyticsWrapper:
             _rows = None
 
         if _rows is None:
-            pga_logger.debug(f"{self.__class__.__name__}.get_gsc_response() :: empty gsc response")
+            pga_logger.debug("%s.get_gsc_response() :: empty gsc response", self.__class__.__name__)
             if _print_log:
                 print(f"{self.__class__.__name__}.get_gsc_response() :: empty gsc response")
             # raise EmptyResponseError("GSC", start_date=start_date, end_date=end_date)
@@ -346,40 +684,42 @@ class GoogalyticsWrapper:
                          filter_google_organic: bool = False,
                          _print_log: bool = False) -> Optional[dict]:
 
-        ga_dimensions = ['ga:' + _s if not re.match(r'ga:', _s) else _s for _s in dimensions]
-        ga_metrics = ['ga:'+_s if not re.match(r'ga:', _s) else _s for _s in metrics]
+        ga_dimensions = [_s if _s.startswith('ga:') else 'ga:' + _s for _s in dimensions]
+        ga_metrics = [_s if _s.startswith('ga:') else 'ga:' + _s for _s in metrics]
 
-        r = self._ga3_response_raw(
+        # the request only changes by its pageToken between pages, so it is built once
+        _request_dict = self._ga3_report_request(
             start_date=start_date,
             end_date=end_date,
             ga_dimensions=ga_dimensions,
             ga_metrics=ga_metrics,
             ga_filters=ga_filters,
-            filter_google_organic=filter_google_organic,
-            page_token=None
+            filter_google_organic=filter_google_organic
         )
 
-        data = r.get('reports', [{}])[0].get('data', {}).get('rows', [])
-        column_header = r.get('reports', [{}])[0].get('columnHeader')
-        next_page_token = r.get('reports', [{}])[0].get('nextPageToken')
-        error = r.get('error', None)
-        error_type = r.get('error_type', None)
+        r = self._ga3_response_raw(_request_dict, end_date=end_date)
+
+        _report = (r.get('reports') or [{}])[0]
+        data = (_report.get('data') or {}).get('rows') or []
+        column_header = _report.get('columnHeader')
+        next_page_token = _report.get('nextPageToken')
+        error = r.get('error')
+        error_type = r.get('error_type')
+        stale_error = r.get('stale_error')
 
+        # each page is parsed on the executor while the next one is being fetched
+        _parsed_pages = []
         while next_page_token and not error:
-            r = self._ga3_response_raw(
-                start_date=start_date,
-                end_date=end_date,
-                ga_dimensions=ga_dimensions,
-                ga_metrics=ga_metrics,
-                ga_filters=ga_filters,
-                filter_google_organic=filter_google_organic,
-                page_token=next_page_token
-            )
-            error = r.get('error', None)
-            error_type = r.get('error_type', None)
-            _d = r.get('reports', [dict()])[0].get('data', dict()).get('rows', [])
-            data.extend(_d)
-            next_page_token = r.get('reports', [{}])[0].get('nextPageToken')
+            if column_header is not None:
+                _parse = functools.partial(parse_ga3_response, column_header=column_header, response_rows=data)
+                _parsed_pages.append((_parse, self._executor.submit(_parse)))
+            r = self._ga3_response_raw(_request_dict, end_date=end_date, page_token=next_page_token)
+            error = r.get('error')
+            error_type = r.get('error_type')
+            stale_error = stale_error or r.get('stale_error')
+            _report = (r.get('reports') or [{}])[0]
+            data = (_report.get('data') or {}).get('rows') or []
+            next_page_token = _report.get('nextPageToken')
 
         # print(f"\ndimensions: {ga_dimensions} \n"
         #       f"metrics: {ga_metrics} \n "
@@ -389,6 +729,11 @@ class GoogalyticsWrapper:
 
         if column_header is not None:
             response = parse_ga3_response(column_header=column_header, response_rows=data)
+            if _parsed_pages:
+                _rows = [_row for _parse, _future in _parsed_pages for _row in _run_or_wait(_parse, _future)['rows']]
+                _rows.extend(response['rows'])
+                response['rows'] = _rows
+                response['row_count'] = len(_rows)
         else:
             response = {
                 'dimension_headers': dimensions,
@@ -400,6 +745,9 @@ class GoogalyticsWrapper:
         response['response_type'] = 'GA3'
         response['start_date'] = start_date
         response['end_date'] = end_date
+        if stale_error:
+            response['stale'] = True
+            response['stale_error'] = stale_error
 
         response['error'] = error
         response['error_type'] = error_type
@@ -407,16 +755,15 @@ class GoogalyticsWrapper:
         return response
 
     def _ga3_response_raw(self,
-                          start_date: datetime.date,
+                          request_dict: dict,
                           end_date: datetime.date,
-                          ga_dimensions: list[str],
-                          ga_metrics: List[str],
-                          ga_filters: dict | None = None,
-                          filter_google_organic: bool = False,
                           return_raw_response: bool = False,
                           page_token: str = None,
                           _print_log: bool = False):
-
+        """
+        @param request_dict: a report request built by `_ga3_report_request`
+        @param page_token: nextPageToken of the previous page, added to a copy of request_dict
+        """
         if not self.view_id:
             _r = {
                 'error': PermissionError("view_id is not set"),
@@ -424,22 +771,70 @@ class GoogalyticsWrapper:
             }
             return _r
 
-        start_date_string = start_date.strftime("%Y-%m-%d")
-        end_date_string = end_date.strftime("%Y-%m-%d")
+        _request_dict = {**request_dict, 'pageToken': page_token} if page_token else request_dict
 
+        _error = None
+        _error_type = None
+        try:
+            ga3_response = self._ga3_batch_raw([_request_dict], end_date=end_date)
+            if return_raw_response:
+                pga_logger.info("%s.get_ga3_response() :: returning raw response", self.__class__.__name__)
+                return ga3_response
+        except GoogleApiHttpError as http_error:
+            _error = http_error
+            _msg = ''
+            _message = repr(http_error).lower()
+            if general_utils.RE_INSUFFICIENT_PERMISSIONS.search(_message):
+                _error_type = 'insufficient_permissions'
+                _msg = f"{self.__class__.__name__}.get_ga3_response() :: user does not have sufficient permissions"
+            if general_utils.RE_VIEW_ID_NOT_SET.search(_message):
+                _error_type = 'missing_view_id'
+                _msg = f"{self.__class__.__name__}.get_ga3_response() :: view id is not set"
+            ga3_response = None
+        except Exception as _e:
+            _error = _e
+            _error_type = 'other'
+            ga3_response = None
+
+        if ga3_response is None:
+            ga3_response = dict()
+        else:
+            try:
+                _rows = ga3_response.get('reports', [])[0].get('data').get('rows', None)
+            except (AttributeError, KeyError) as _e:
+                _rows = None
+
+            if _rows is None:
+                _error = AttributeError('ga3_response in incorrect format.')
+                _error_type = 'empty_response'
+                pga_logger.debug("%s.get_ga3_response() :: empty ga response", self.__class__.__name__)
+                # raise EmptyResponseError("GA3", start_date=start_date, end_date=end_date)
+
+        ga3_response['error'] = _error
+        ga3_response['error_type'] = _error_type
+
+        return ga3_response
+
+    def _ga3_report_request(self,
+                            start_date: datetime.date,
+                            end_date: datetime.date,
+                            ga_dimensions: list[str],
+                            ga_metrics: List[str],
+                            ga_filters: dict | None = None,
+                            filter_google_organic: bool = False) -> dict:
         _dfc = []  # dimension filter clauses
         _mfc = []  # metric filter clauses
         _orderby = []
 
         if ga_filters:
             for filter_dict in ga_filters:
-                if not isinstance(filter_dict.get('filters'), list):
+                _filters = filter_dict.get('filters')
+                if not _filters or not isinstance(_filters, list):
                     continue
-                if len(filter_dict.get('filters')) != 0:
-                    if filter_dict.get('filters')[0].get('dimensionName'):
-                        _dfc.append(filter_dict)
-                    elif filter_dict.get('filters')[0].get('metricName'):
-                        _mfc.append(filter_dict)
+                if _filters[0].get('dimensionName'):
+                    _dfc.append(filter_dict)
+                elif _filters[0].get('metricName'):
+                    _mfc.append(filter_dict)
 
         if filter_google_organic is True:
             _dfc.append({"operator": 'OR',
@@ -460,7 +855,7 @@ class GoogalyticsWrapper:
 
         _request_dict = {
             'viewId': self.view_id,
-            'dateRanges': [{'startDate': start_date_string, 'endDate': end_date_string}],
+            'dateRanges': [{'startDate': start_date.isoformat(), 'endDate': end_date.isoformat()}],
             # 'dimensions': [{'name': 'ga:productName'}],
             # 'metrics': [{'expression': 'ga:itemRevenue'}]
             'dimensions': [{'name': _d} for _d in ga_dimensions],
@@ -471,59 +866,87 @@ class GoogalyticsWrapper:
             'pageSize': 100_000
         }
 
-        if page_token:
-            _request_dict.update({'pageToken': page_token})
+        return _request_dict
 
-        ga3_request = {'reportRequests': [_request_dict]}
+    def _ga3_batch_raw(self, report_requests: list[dict], end_date: datetime.date) -> dict:
+        """Send up to 5 report requests (sharing one view and date range) in a single batchGet call."""
+        ga3_request = {'reportRequests': report_requests}
+        # shallow copy: keys added by callers must not leak into the cached response
+        return dict(self._cached_call(
+            'GA3', ga3_request, end_date,
+            lambda: self.ga3_resource.reports().batchGet(body=ga3_request).execute(
+                http=thread_http(self.ga3_resource))
+        ))
 
-        _error = None
-        _error_type = None
-        try:
-            ga3_response = self.ga3_resource.reports().batchGet(body=ga3_request).execute()
-            if return_raw_response:
-                pga_logger.info(f"{self.__class__.__name__}.get_ga3_response() :: returning raw response")
-                return ga3_response
-        except GoogleApiHttpError as http_error:
-            _error = http_error
-            _msg = ''
-            if re.match(".*user does not have sufficient permissions", repr(http_error).lower()):
-                _error_type = 'insufficient_permissions'
-                _msg = f"{self.__class__.__name__}.get_ga3_response() :: user does not have sufficient permissions"
-            if re.match(".*viewid must be set", repr(http_error).lower()):
-                _error_type = 'missing_view_id'
-                _msg = f"{self.__class__.__name__}.get_ga3_response() :: view id is not set"
-            ga3_response = None
-        except Exception as _e:
-            _error = _e
-            _error_type = 'other'
-            ga3_response = None
-
-        if ga3_response is None:
-            ga3_response = dict()
-        else:
-            try:
-                _rows = ga3_response.get('reports', [])[0].get('data').get('rows', None)
-            except (AttributeError, KeyError) as _e:
-                _rows = None
-
-            if _rows is None:
-                _error = AttributeError('ga3_response in incorrect format.')
-                _error_type = 'empty_response'
-                pga_logger.debug(f"{self.__class__.__name__}.get_ga3_response() :: empty ga response")
-                # raise EmptyResponseError("GA3", start_date=start_date, end_date=end_date)
-
-        ga3_response['error'] = _error
-        ga3_response['error_type'] = _error_type
-
-        return ga3_response
-
-    def _ga4_response_raw(self,
-                         start_date: datetime.date,
-                         end_date: datetime.date,
-                         ga4_dimensions: list[ga_data_types.Dimension],
-                         ga4_metrics: list[ga_data_types.Metric],
-                         limit: int,
-                         offset: int):
+    def get_ga3_responses_batch(self, report_specs: list[dict]) -> list[dict]:
+        """
+        Fetch several GA3 reports with as few API calls as possible.
+        batchGet accepts up to 5 reports per call, all sharing one view and date range, so the specs are grouped
+        by date range and sent 5 at a time. Reports that need more than one page, or whose batch fails,
+        are fetched individually with `get_ga3_response`.
+
+        @param report_specs: dicts of `get_ga3_response` keyword arguments:
+        start_date, end_date, dimensions, metrics and optionally ga_filters
+        @returns: list of response dictionaries (as returned by `get_ga3_response`), in the order of report_specs
+        """
+        if not self.view_id:
+            return [self.get_ga3_response(**_spec) for _spec in report_specs]
+
+        responses: list = [None] * len(report_specs)
+        _groups: dict = {}
+        for _i, _spec in enumerate(report_specs):
+            _groups.setdefault((_spec['start_date'], _spec['end_date']), []).append(_i)
+
+        for (_start_date, _end_date), _indices in _groups.items():
+            for _chunk in [_indices[_j:_j + 5] for _j in range(0, len(_indices), 5)]:
+                _requests = [
+                    self._ga3_report_request(
+                        start_date=_start_date,
+                        end_date=_end_date,
+                        ga_dimensions=[_s if _s.startswith('ga:') else 'ga:' + _s for _s in report_specs[_i]['dimensions']],
+                        ga_metrics=[_s if _s.startswith('ga:') else 'ga:' + _s for _s in report_specs[_i]['metrics']],
+                        ga_filters=report_specs[_i].get('ga_filters')
+                    ) for _i in _chunk
+                ]
+                # an HTTP error (after _call_api's retries) falls back to individual requests, so one invalid
+                # report cannot fail the others; anything else (auth, programming errors) propagates
+                try:
+                    _batch = self._ga3_batch_raw(_requests, end_date=_end_date)
+                except GoogleApiHttpError as _e:
+                    pga_logger.debug("%s.get_ga3_responses_batch() :: batch failed, requesting reports "
+                                     "individually: %r", self.__class__.__name__, _e)
+                    _batch = {}
+                _reports = _batch.get('reports', [])
+                _stale_error = _batch.get('stale_error')
+
+                for _n, _i in enumerate(_chunk):
+                    _report = _reports[_n] if _n < len(_reports) else None
+                    if _report is None or _report.get('nextPageToken') or _report.get('columnHeader') is None:
+                        responses[_i] = self.get_ga3_response(**report_specs[_i])
+                        continue
+
+                    _rows = _report.get('data', {}).get('rows')
+                    response = parse_ga3_response(column_header=_report.get('columnHeader'), response_rows=_rows or [])
+                    response['response_type'] = 'GA3'
+                    response['start_date'] = _start_date
+                    response['end_date'] = _end_date
+                    if _stale_error:
+                        response['stale'] = True
+                        response['stale_error'] = _stale_error
+                    response['error'] = None if _rows else AttributeError('ga3_response in incorrect format.')
+                    response['error_type'] = None if _rows else 'empty_response'
+                    responses[_i] = response
+
+        return responses
+
+    def _ga4_response_dict(self,
+                           start_date: datetime.date,
+                           end_date: datetime.date,
+                           ga4_dimensions: list[ga_data_types.Dimension],
+                           ga4_metrics: list[ga_data_types.Metric],
+                           limit: int,
+                           offset: int) -> dict:
+        """Run one GA4 report page and return it parsed by `parse_ga4_response`."""
 
         if not self.ga4_property_id:
             raise MissingID("ga4_property_id is not set")
@@ -534,17 +957,60 @@ class GoogalyticsWrapper:
             metrics=ga4_metrics,
             date_ranges=[
                 ga_data_types.DateRange(
-                    start_date=start_date.strftime("%Y-%m-%d"),
-                    end_date=end_date.strftime("%Y-%m-%d")
+                    start_date=start_date.isoformat(),
+                    end_date=end_date.isoformat()
                 )
             ],
             limit=limit,
             offset=offset,
             return_property_quota=True
         )
-        ga4_response = self.ga4_resource.run_report(request)
-
-        return ga4_response
+        _cache_request = {
+            'property': self.ga4_property_id,
+            'dimensions': [_.name for _ in ga4_dimensions],
+            'metrics': [_.name for _ in ga4_metrics],
+            'start_date': start_date, 'end_date': end_date,
+            'limit': limit, 'offset': offset,
+            'format': 'parsed'  # distinguishes these entries from older protobuf-bytes entries
+        }
+        # the parsed response dictionary is cached, so cache hits skip the protobuf entirely;
+        # shallow copy: keys added by callers must not leak into the cached response
+        return dict(self._cached_call(
+            'GA4', _cache_request, end_date,
+            lambda: parse_ga4_response(self.ga4_resource.run_report(request))
+        ))
+
+    def _ga4_page(self,
+                  start_date: datetime.date,
+                  end_date: datetime.date,
+                  ga4_dimensions: list[ga_data_types.Dimension],
+                  ga4_metrics: list[ga_data_types.Metric],
+                  limit: int,
+                  offset: int) -> tuple:
+        """
+        Fetch and parse one page of a GA4 report. Errors in GA4_FATAL_ERRORS are returned straight away,
+        any other error is retried (with backoff) up to GA4_PAGE_ATTEMPTS times.
+        @returns: (parsed response dictionary or None, error, error_type)
+        """
+        error = None
+        for _attempt in range(GA4_PAGE_ATTEMPTS):
+            if _attempt:
+                time.sleep(RETRY_BASE * 2 ** (_attempt - 1) + random.uniform(0, RETRY_JITTER))
+            try:
+                ga4_response = self._ga4_response_dict(
+                    start_date=start_date,
+                    end_date=end_date,
+                    ga4_dimensions=ga4_dimensions,
+                    ga4_metrics=ga4_metrics,
+                    limit=limit,
+                    offset=offset
+                )
+                return ga4_response, None, None
+            except GA4_FATAL_ERRORS as _fatal_error:
+                return None, _fatal_error, _ga4_error_type(_fatal_error)
+            except Exception as _e:
+                error = _e
+        return None, error, "Error"
 
     def get_ga4_response(self,
                          start_date: datetime.date,
@@ -553,8 +1019,8 @@ class GoogalyticsWrapper:
                          metrics: list[str],
                          limit: int | None = None) -> (list, dict, Any):
 
-        ga_dimensions = [ga_data_types.Dimension(name=_) for _ in dimensions]
-        ga_metrics = [ga_data_types.Metric(name=_) for _ in metrics]
+        ga_dimensions = list(_ga4_dimensions(tuple(dimensions)))
+        ga_metrics = list(_ga4_metrics(tuple(metrics)))
 
         request_limit = 100_000
         if limit is None:
@@ -562,74 +1028,33 @@ class GoogalyticsWrapper:
         elif limit < 100_000:
             request_limit = limit
 
-        complete: bool = False
-        error_type: str | None = None
+        _page_kwargs = dict(start_date=start_date, end_date=end_date,
+                            ga4_dimensions=ga_dimensions, ga4_metrics=ga_metrics, limit=request_limit)
+
         responses: list[dict] = []
-        error = None
-        offset: int = 0
-
-        while not complete:
-            num_tries = 0
-            success = False
-            response = dict()
-            while num_tries < 3 and not success:
-                error = None
-                try:
-                    ga4_response = self._ga4_response_raw(
-                        start_date=start_date,
-                        end_date=end_date,
-                        ga4_dimensions=ga_dimensions,
-                        ga4_metrics=ga_metrics,
-                        limit=request_limit,
-                        offset=offset
-                    )
-                    response = parse_ga4_response(ga4_response)
-                    success = True
-                except PermissionDenied as _permission_denied_error:
-                    complete = True
-                    error_type = 'PermissionDenied'
-                    error = _permission_denied_error
-                    num_tries = 1_000
-                except ResourceExhausted as _resource_exhausted_error:
-                    error_type = 'ResourceExhausted'
-                    complete = True
-                    error = _resource_exhausted_error
-                    num_tries = 1_000
-                except MissingID as _id_error:
-                    complete = True
-                    error_type = 'MissingID'
-                    error = _id_error
-                    num_tries = 1_000
-                except InvalidArgument as _invalid_argument_error:
-                    error_type = 'InvalidArgument'
-                    if re.search(r"metrics are incompatible", _invalid_argument_error.message):
-                        error_type = 'IncompatibleMetrics'
-                    if re.search(r"Invalid property ID", _invalid_argument_error.message):
-                        error_type = 'InvalidPropertyID'
-                    complete = True
-                    error = _invalid_argument_error
-                    num_tries = 1_000
-                except Exception as _e:
-                    error_type = "Error"
-                    error = _e
-                    num_tries += 1
-
-            if success:
-                offset += response.get('row_count', 0)
-                if offset >= limit:
-                    complete = True
-                if response.get('row_count', 0) == 0 or offset >= response.get('meta_row_count', 1_000_000_000):
-                    complete = True
-
-                responses.append(response)
-
-        if len(responses) > 1:
-            response = join_ga4_responses(responses)
-            if response.get('row_count', 0) == 0:
-                error = AttributeError("Empty response")
-                error_type = "EmptyResponse"
-        elif len(responses) == 1:
-            response = responses[0]
+        response, error, error_type = self._ga4_page(offset=0, **_page_kwargs)
+        if response is not None:
+            responses.append(response)
+
+            # the first page reports the total row count, so the remaining pages can be requested together
+            _row_count = response.get('row_count', 0)
+            _total = min(response.get('meta_row_count', 0), limit)
+            _offsets = list(range(_row_count, _total, _row_count)) if _row_count > 0 else []
+            if _offsets:
+                _pages = self._gather_list([functools.partial(self._ga4_page, offset=_offset, **_page_kwargs)
+                                            for _offset in _offsets])
+                for _page_response, _page_error, _page_error_type in _pages:
+                    if _page_response is None:
+                        error, error_type = _page_error, _page_error_type
+                        break
+                    responses.append(_page_response)
+
+        if responses:
+            response = join_ga4_responses(responses) if len(responses) > 1 else responses[0]
+            _stale_errors = [_r['stale_error'] for _r in responses if _r.get('stale')]
+            if _stale_errors:
+                response['stale'] = True
+                response['stale_error'] = _stale_errors[0]
             if response.get('row_count', 0) == 0:
                 error = AttributeError("Empty response")
                 error_type = "EmptyResponse"
@@ -649,57 +1074,149 @@ class GoogalyticsWrapper:
 
         return response
 
+    def get_ga4_responses_batch(self, report_specs: list[dict]) -> list[dict]:
+        """
+        Fetch several GA4 reports with batchRunReports, up to 5 reports per API call.
+        Reports with more rows than one page holds, or whose batch fails with an invalid argument or server error,
+        are fetched individually with `get_ga4_response` (which classifies errors and paginates).
+        Other batch errors (permissions, quota) are raised.
+
+        @param report_specs: dicts of `get_ga4_response` keyword arguments:
+        start_date, end_date, dimensions, metrics and optionally limit
+        @returns: list of response dictionaries (as returned by `get_ga4_response`), in the order of report_specs
+        """
+        if not self.ga4_property_id:
+            return [self.get_ga4_response(**_spec) for _spec in report_specs]
+
+        responses: list = [None] * len(report_specs)
+        for _j in range(0, len(report_specs), 5):
+            _chunk = list(range(_j, min(_j + 5, len(report_specs))))
+            _request = ga_data_types.BatchRunReportsRequest(
+                property=f"properties/{self.ga4_property_id}",
+                requests=[
+                    ga_data_types.RunReportRequest(
+                        dimensions=list(_ga4_dimensions(tuple(report_specs[_i]['dimensions']))),
+                        metrics=list(_ga4_metrics(tuple(report_specs[_i]['metrics']))),
+                        date_ranges=[
+                            ga_data_types.DateRange(
+                                start_date=report_specs[_i]['start_date'].isoformat(),
+                                end_date=report_specs[_i]['end_date'].isoformat()
+                            )
+                        ],
+                        limit=min(report_specs[_i].get('limit') or 100_000, 100_000),
+                        return_property_quota=True
+                    ) for _i in _chunk
+                ]
+            )
+            # an invalid report fails the whole batch, and a server error may not recur for smaller requests
+            # (which can also fall back to a cached response), so these fall back to individual requests;
+            # permission, quota and any other errors would fail every report again and propagate
+            try:
+                _reports = list(_call_api(lambda: self.ga4_resource.batch_run_reports(_request)).reports)
+            except (InvalidArgument, ServiceUnavailable, InternalServerError, DeadlineExceeded) as _e:
+                pga_logger.debug("%s.get_ga4_responses_batch() :: batch failed, requesting reports "
+                                 "individually: %r", self.__class__.__name__, _e)
+                _reports = []
+
+            for _n, _i in enumerate(_chunk):
+                _spec = report_specs[_i]
+                response = parse_ga4_response(_reports[_n]) if _n < len(_reports) else None
+                if response is None or response['row_count'] < min(response['meta_row_count'],
+                                                                    _spec.get('limit') or 1_000_000_000):
+                    responses[_i] = self.get_ga4_response(**_spec)
+                    continue
+
+                response['start_date'] = _spec['start_date']
+                response['end_date'] = _spec['end_date']
+                response['error'] = None if response['row_count'] else AttributeError("Empty response")
+                response['error_type'] = None if response['row_count'] else "EmptyResponse"
+                responses[_i] = response
+
+        return responses
+
+    def _source_id(self, result: str) -> Optional[str]:
+        """The configured ID (view_id, ga4_property_id or sc_domain) needed for a "GA3", "GA4" or "GSC" result."""
+        if result.startswith("GA3"):
+            return self.view_id
+        if result.startswith("GA4"):
+            return self.ga4_property_id
+        if result.startswith("GSC"):
+            return self.sc_domain
+        raise KeyError(f"invalid result {result}")
+
     def get_dates(self,
                   result: str,
                   start_date: Optional[Union[datetime.date, str, int]] = None,
                   end_date: Optional[Union[datetime.date, str]] = None,
-                  reverse: bool = False) -> List[datetime.date]:
+                  reverse: bool = False,
+                  raise_errors: bool = False) -> List[datetime.date]:
+        """
+        Dates with data for `result` ("GA3", "GA4" or "GSC"), by default from 1500 (GA) or 500 (GSC) days ago
+        until yesterday.
+        @param raise_errors: raise the API error instead of returning an empty list when the request fails
+        """
+
+        if not self._source_id(result):
+            return []
+
+        _today = datetime.date.today()
 
         # set the end_date to yesterday by default.
         # GA data is "available" for today but it is not the whole day.
         if end_date is None:
-            end_date = datetime.date.today() + datetime.timedelta(days=-1)
+            end_date = _today + datetime.timedelta(days=-1)
 
-        if isinstance(start_date, str):
-            start_date = datetime.datetime.strptime(start_date, '%Y-%m-%d').date()
-        if isinstance(end_date, str):
-            end_date = datetime.datetime.strptime(end_date, '%Y-%m-%d').date()
+        start_date = _to_date(start_date)
+        end_date = _to_date(end_date)
 
         if isinstance(start_date, int):
             start_date = end_date + datetime.timedelta(days=-1 * start_date)
 
-        if re.match(r"GA3", result):
+        if result.startswith("GA3") or result.startswith("GA4"):
             if start_date is None:
-                start_date = datetime.date.today() + datetime.timedelta(days=-1500)
-            dimensions = ['ga:date']
-            metrics = ['ga:sessions']
-        elif re.match(r"GA4", result):
+                start_date = _today + datetime.timedelta(days=-1500)
+        elif result.startswith("GSC"):
             if start_date is None:
-                start_date = datetime.date.today() + datetime.timedelta(days=-1500)
-            dimensions = ['date']
-            metrics = ['sessions']
-        elif re.match(r"GSC", result):
-            if start_date is None:
-                start_date = datetime.date.today() + datetime.timedelta(days=-500)
-            dimensions = ['date']
-            metrics = None
+                start_date = _today + datetime.timedelta(days=-500)
         else:
             raise KeyError(f"invalid result {result}")
 
-        _df = self.get_df(result=result,
-                          start_date=start_date,
-                          end_date=end_date,
-                          dimensions=dimensions,
-                          metrics=metrics,
-                          add_boolean_metrics=False)
+        return sorted(self._dates_only(result[:3], start_date=start_date, end_date=end_date,
+                                       raise_errors=raise_errors), reverse=reverse)
 
-        if _df is None or "record_date" not in _df.columns or len(_df) == 0:
+    def _dates_only(self,
+                    result: str,
+                    start_date: datetime.date,
+                    end_date: datetime.date,
+                    raise_errors: bool = False) -> List[datetime.date]:
+        """
+        Dates with data between start_date and end_date, read straight from the API response rows
+        (without building a dataframe).
+        @param result: "GA3", "GA4" or "GSC"
+        @param raise_errors: raise the API error of a failed request (an empty response is not an error)
+        @returns: unsorted list of dates, empty if the request fails
+        """
+        if result == "GSC":
+            _response = self.get_gsc_response(start_date=start_date, end_date=end_date, gsc_dimensions=['date'],
+                                              raise_http_error=raise_errors)
+            if _response is None:
+                return []
+            return [datetime.date.fromisoformat(_row['keys'][0]) for _row in _response.get('rows', [])]
+
+        if result == "GA3":
+            _response = self.get_ga3_response(start_date=start_date, end_date=end_date,
+                                              dimensions=['ga:date'], metrics=['ga:sessions'])
+        else:
+            _response = self.get_ga4_response(start_date=start_date, end_date=end_date,
+                                              dimensions=['date'], metrics=['sessions'])
+        if _response.get('error') is not None and not _response.get('rows'):
+            if raise_errors and _response.get('error_type') not in ('empty_response', 'EmptyResponse'):
+                raise _response['error']
             return []
+        # GA dates are YYYYMMDD strings
+        return [datetime.date(int(_s[:4]), int(_s[4:6]), int(_s[6:8]))
+                for _s in (_row.get('date') for _row in _response.get('rows', [])) if _s]
 
-        if "record_date" not in _df.columns or len(_df) == 0:
-            return []
-        else:
-            return sorted(list(_df["record_date"]), reverse=reverse)
 
     # *****************************************************************************************
     # *** Return dataframe *****************************************************************
@@ -716,7 +1233,8 @@ class GoogalyticsWrapper:
                filters: List[dict] = None,
                add_boolean_metrics: bool = False,
                _return_response: bool = False,
-               raise_errors: bool = True
+               raise_errors: bool = True,
+               categorise_dimensions: bool = False
                ) -> Union[gpd.GADataFrame, gpd.GSCDataFrame, pd.DataFrame]:
         """
         The `get_df` method accepts the following values for the `result` argument:
@@ -724,6 +1242,9 @@ class GoogalyticsWrapper:
         - "GA3": for Google Analytics 3 (UA) data
         - "URL": for Google Search Console URL inspection data
         - "GA4": for Google Analytics 4 data (note, this is not yet available in production)
+
+        @param categorise_dimensions: dictionary-encode the repeated string dimensions as pandas categoricals
+        (see `categorise_dimensions` on GADataFrame and GSCDataFrame)
         """
 
         if start_date is None:
@@ -735,10 +1256,8 @@ class GoogalyticsWrapper:
         if end_date is None:
             end_date = start_date
 
-        if isinstance(start_date, str):
-            start_date = datetime.datetime.strptime(start_date, '%Y-%m-%d').date()
-        if isinstance(end_date, str):
-            end_date = datetime.datetime.strptime(end_date, '%Y-%m-%d').date()
+        start_date = _to_date(start_date)
+        end_date = _to_date(end_date)
 
         if isinstance(dimensions, str):
             dimensions = [dimensions]
@@ -747,9 +1266,10 @@ class GoogalyticsWrapper:
         if isinstance(url_list, str):
             url_list = [url_list]
 
-        if re.match(r"GA4", result):
-            return self._get_analytics_df(
-                response_type='GA4',
+        _kind, _detail = _result_dispatch(result)
+        if _kind == 'analytics':
+            df = self._get_analytics_df(
+                response_type=_detail,
                 start_date=start_date,
                 end_date=end_date,
                 dimensions=dimensions,
@@ -759,38 +1279,81 @@ class GoogalyticsWrapper:
                 filters=filters,
                 return_response=_return_response,
             )
-        elif re.match(r"GA3", result):
-            return self._get_analytics_df(
-                response_type='GA3',
-                start_date=start_date,
-                end_date=end_date,
-                dimensions=dimensions,
-                metrics=metrics,
-                filters=filters,
-                add_boolean_metrics=add_boolean_metrics,
-                return_response=_return_response
-            )
-        elif re.match(r"GSC", result) and result != "GSCQ":
+        elif _kind == 'gsc':
             if row_limit is None:
                 row_limit = 100000
-            return self._get_gsc_df(start_date=start_date,
-                                    end_date=end_date,
-                                    gsc_dimensions=dimensions,
-                                    row_limit=row_limit,
-                                    add_boolean_metrics=add_boolean_metrics)
-        elif result == 'GSCQ':
-            if row_limit is None:
-                row_limit = 100000
-            return self._get_gsc_df(start_date=start_date,
-                                    end_date=end_date,
-                                    gsc_dimensions=['query'],
-                                    row_limit=row_limit,
-                                    add_boolean_metrics=add_boolean_metrics)
-        elif result == 'URL':
-            return self._get_urlinspection_df(url_list=url_list)
+            df = self._get_gsc_df(start_date=start_date,
+                                  end_date=end_date,
+                                  gsc_dimensions=list(_detail) if _detail else dimensions,
+                                  row_limit=row_limit,
+                                  add_boolean_metrics=add_boolean_metrics)
+        elif _kind == 'url':
+            return self._get_urlinspection_df(url_list=url_list, categorise_dimensions=categorise_dimensions)
         else:
             raise KeyError(f"invalid result {result}")
 
+        if categorise_dimensions and isinstance(df, (gpd.GADataFrame, gpd.GSCDataFrame)):
+            df.categorise_dimensions()
+        return df
+
+    def get_all(self,
+                start_date: Union[str, datetime.date] = None,
+                end_date: Optional[Union[str, datetime.date]] = None,
+                gsc_dimensions: Optional[Union[str, List[str]]] = None,
+                ga3_dimensions: Optional[Union[str, List[str]]] = None,
+                ga3_metrics: Optional[Union[str, List[str]]] = None,
+                ga4_dimensions: Optional[Union[str, List[str]]] = None,
+                ga4_metrics: Optional[Union[str, List[str]]] = None,
+                row_limit: Optional[int] = None,
+                add_boolean_metrics: bool = False) -> dict:
+        """
+        Fetch GSC, GA3 and GA4 dataframes concurrently, one task per source.
+        Only sources with a configured ID (sc_domain, view_id, ga4_property_id) are requested;
+        the others are returned as None.
+
+        @returns: {"GSC": GSCDataFrame | None, "GA3": GADataFrame | None, "GA4": GADataFrame | None}
+        """
+        _requests = {
+            "GSC": (self.sc_domain, dict(dimensions=gsc_dimensions)),
+            "GA3": (self.view_id, dict(dimensions=ga3_dimensions, metrics=ga3_metrics)),
+            "GA4": (self.ga4_property_id, dict(dimensions=ga4_dimensions, metrics=ga4_metrics)),
+        }
+        _requests = {_result: _kwargs for _result, (_id, _kwargs) in _requests.items() if _id}
+
+        results = {"GSC": None, "GA3": None, "GA4": None}
+        if not _requests:
+            return results
+
+        results.update(self._gather(**{
+            _result: functools.partial(self.get_df,
+                                       result=_result,
+                                       start_date=start_date,
+                                       end_date=end_date,
+                                       row_limit=row_limit,
+                                       add_boolean_metrics=add_boolean_metrics,
+                                       **_kwargs)
+            for _result, _kwargs in _requests.items()
+        }))
+
+        return results
+
+    def get_df_many(self,
+                    result: str,
+                    date_ranges: List[Tuple[Union[str, datetime.date], Union[str, datetime.date]]],
+                    **kwargs) -> list:
+        """
+        Fetch one dataframe per (start_date, end_date) pair concurrently, as `get_df` would for each range.
+        GA3 batchGet can only combine reports that share a date range (see `get_ga3_responses_batch`), so the
+        ranges are requested in parallel rather than in one batch.
+
+        @param kwargs: any other `get_df` keyword arguments, applied to every date range
+        @returns: list of dataframes, in the order of date_ranges
+        """
+        return self._gather_list([
+            functools.partial(self.get_df, result=result, start_date=_start_date, end_date=_end_date, **kwargs)
+            for _start_date, _end_date in date_ranges
+        ])
+
     def _get_gsc_df_raw(self,
                         start_date: datetime.date,
                         end_date: datetime.date,
@@ -805,43 +1368,63 @@ class GoogalyticsWrapper:
             # Make an empty GSCDataFrame
             gsc_df = gpd.GSCDataFrame(df_input=None,
                                       gsc_dimensions=gsc_dimensions)
-            _response_aggregation = None
-        else:
-            # Make a dataframe of the gsc response
-            gsc_df = gpd.from_response(response=gsc_response,
-                                       response_type="GSC",
-                                       gsc_dimensions=gsc_dimensions)
-            _response_aggregation = gsc_df.response_aggregation
-
-        if (row_limit > 25000) and (len(gsc_df) == 25000):
-            temp_row_limit = row_limit - 25000
-            temp_start_row = 25000  # not 25001: "Zero-based index of the first row in the response"
-            frames = [gsc_df]
-            while temp_row_limit > 0:
-
-                gsc_response2 = self.get_gsc_response(start_date=start_date, end_date=end_date,
-                                                      gsc_dimensions=gsc_dimensions,
-                                                      row_limit=min(temp_row_limit, 25000),
-                                                      start_row=temp_start_row)
-                if gsc_response2 is None:
-                    break  # exit the while loop if we get an empty response
+            gsc_df.response_aggregation = None
+            return gsc_df
 
-                # Make a dataframe of the second gsc response
-                new_gsc_df = gpd.from_response(response=gsc_response2,
-                                               response_type="GSC",
-                                               gsc_dimensions=gsc_dimensions)
-                frames.append(new_gsc_df)
+        # only a full first page can be followed by more rows
+        if (row_limit > 25000) and (len(gsc_response.get('rows', [])) == 25000):
+            gsc_response = self._get_gsc_remaining_pages(gsc_response, start_date=start_date, end_date=end_date,
+                                                         row_limit=row_limit, gsc_dimensions=gsc_dimensions)
 
-                temp_row_limit -= 25000
-                temp_start_row += 25000
+        gsc_df = gpd.from_response(response=gsc_response,
+                                   response_type="GSC",
+                                   gsc_dimensions=gsc_dimensions)
+
+        return gsc_df
 
-            if len(frames) > 1:
-                gsc_df = gpd.GSCDataFrame(pd.concat(frames, ignore_index=True),
-                                          gsc_dimensions=gsc_dimensions)
+    def _get_gsc_remaining_pages(self,
+                                 gsc_response: dict,
+                                 start_date: datetime.date,
+                                 end_date: datetime.date,
+                                 row_limit: int,
+                                 gsc_dimensions: List[str]) -> dict:
+        """
+        Fetch the pages after a full first page of a GSC request.
+        @returns: the first response with the rows of all pages
+        """
+        # The raw rows of every page are collected first and parsed into a single GSCDataFrame by the caller,
+        # rather than parsing each page into its own dataframe and concatenating them
+        _pages = [gsc_response.get('rows', [])]
+
+        # GSC does not report the total row count, so further pages are requested concurrently in waves of
+        # GSC_PAGE_WAVE, stopping at the first empty or short page
+        _start_rows = list(range(25000, row_limit, 25000))  # "Zero-based index of the first row in the response"
+        for _i in range(0, len(_start_rows), GSC_PAGE_WAVE):
+            _wave = _start_rows[_i:_i + GSC_PAGE_WAVE]
+            _responses = self._gather_list([
+                functools.partial(self.get_gsc_response,
+                                  start_date=start_date, end_date=end_date,
+                                  gsc_dimensions=gsc_dimensions,
+                                  row_limit=min(row_limit - _start_row, 25000),
+                                  start_row=_start_row)
+                for _start_row in _wave
+            ])
+            _last_page = False
+            for gsc_response2 in _responses:
+                if gsc_response2 is None:
+                    _last_page = True
+                    break  # an empty response: there are no more rows
 
-        gsc_df.response_aggregation = _response_aggregation
+                _pages.append(gsc_response2.get('rows', []))
+                if len(_pages[-1]) < 25000:
+                    _last_page = True
+                    break
+            if _last_page:
+                break
 
-        return gsc_df
+        if len(_pages) == 1:
+            return gsc_response
+        return {**gsc_response, 'rows': [_row for _page in _pages for _row in _page]}
 
     def _get_gsc_df(self,
                     start_date: datetime.date,
@@ -888,17 +1471,15 @@ class GoogalyticsWrapper:
             dimensions = ['dateHour']
         elif isinstance(dimensions, str):
             dimensions = dimensions.split(';')
-        dimensions = [re.sub(r"^ga:", "", _) for _ in dimensions]
+        dimensions = [_.removeprefix("ga:") for _ in dimensions]
 
         if metrics is None:
             metrics = ['itemRevenue']
 
         if not end_date:
             end_date = start_date
-        if isinstance(start_date, str):
-            start_date = general_utils.parse_date(start_date)
-        if isinstance(end_date, str):
-            end_date = general_utils.parse_date(end_date)
+        start_date = _to_date(start_date)
+        end_date = _to_date(end_date)
         if end_date < start_date:
             raise ValueError("date range incompatible: end_date < start_date")
         if start_date > datetime.date.today():
@@ -909,35 +1490,44 @@ class GoogalyticsWrapper:
         if all(isinstance(_, str) for _ in metrics):
             metrics = [metrics]
 
-        metrics_list: list[list[str]] = []
-        for _list in metrics:
-            metrics_list.extend([_list[10 * i:10 * i + 10] for i in range((len(_list) - 1) // 10 + 1)])
-        metrics_list = [[re.sub(r"^ga:", "", _m) for _m in _sub_list] for _sub_list in metrics_list]
+        # the API accepts at most 10 metrics per request
+        metrics_list: list[list[str]] = [[_m.removeprefix("ga:") for _m in _chunk]
+                                         for _list in metrics for _chunk in general_utils.batched(_list, 10)]
 
         responses: list = []
         breaking_error: bool = False
         breaking_error_type: str | None = None
-        for _metrics in metrics_list:
-            if response_type == 'GA3':
-                _r = self.get_ga3_response(
-                    start_date=start_date,
-                    end_date=end_date,
-                    dimensions=dimensions,
-                    metrics=_metrics,
-                    ga_filters=filters,
-                    raise_http_error=False
-                )
-            elif response_type == 'GA4':
-                _r = self.get_ga4_response(
-                    start_date=start_date,
-                    end_date=end_date,
-                    dimensions=dimensions,
-                    metrics=_metrics,
-                    limit=limit
-                )
-            else:
-                raise KeyError("response_type not recognised")
 
+        if response_type not in ('GA3', 'GA4'):
+            raise KeyError("response_type not recognised")
+        _has_id = bool(self._source_id(response_type))
+        if not _has_id:
+            # nothing can be requested: go straight to the empty dataframe
+            if raise_errors:
+                raise MissingID(f"{response_type} ID is not set")
+            breaking_error = True
+            breaking_error_type = 'missing_view_id' if response_type == 'GA3' else 'MissingID'
+
+        if response_type == 'GA3':
+            _fetch = functools.partial(self.get_ga3_response,
+                                       start_date=start_date,
+                                       end_date=end_date,
+                                       dimensions=dimensions,
+                                       ga_filters=filters,
+                                       raise_http_error=False)
+        else:
+            _fetch = functools.partial(self.get_ga4_response,
+                                       start_date=start_date,
+                                       end_date=end_date,
+                                       dimensions=dimensions,
+                                       limit=limit)
+
+        # the metric chunks are independent requests, so they are fetched concurrently; the responses are then
+        # scanned in order and everything after the first breaking error is discarded, as if fetched serially
+        _chunk_responses = self._gather_list([functools.partial(_fetch, metrics=_metrics)
+                                              for _metrics in metrics_list]) if _has_id else []
+
+        for _r in _chunk_responses:
             responses.append(_r)
             if _r.get('error_type') is not None:
                 if _r.get('error_type') in ('empty_response', 'EmptyResponse', 'emptyResponse'):
@@ -971,15 +1561,8 @@ class GoogalyticsWrapper:
             for _f in frames:
                 print(f"{len(_f)}: {_f.columns.to_list()}")
 
-        if len(frames) == 0:
-            dataframe = gpd.GADataFrame(df_input=None,
-                                     dimensions=dimensions,
-                                     metrics=general_utils.expand_list(metrics_list),
-                                     start_date=start_date,
-                                     end_date=end_date,
-                                     error = breaking_error_type)
-
-        elif all(len(_frame) == 0 for _frame in frames):
+        if all(len(_frame) == 0 for _frame in frames):
+            # no frames (a breaking error), or only empty ones
             dataframe = gpd.GADataFrame(df_input=None,
                                      dimensions=dimensions,
                                      metrics=general_utils.expand_list(metrics_list),
@@ -989,9 +1572,7 @@ class GoogalyticsWrapper:
         elif len(frames) == 1:
             dataframe = frames[0]
         else:
-            dataframe = frames[0]
-            for i in range(1, len(frames)):
-                dataframe = dataframe.join_on_dimensions(frames[i], how="outer")
+            dataframe = gpd.GADataFrame.multi_join_on_dimensions(frames, how="outer")
             if len(dataframe) == 0 and not dataframe.error:
                 dataframe.error = 'empty_response'
 
@@ -1002,13 +1583,20 @@ class GoogalyticsWrapper:
             dataframe.add_shopping_stage_all_column()
             dataframe.add_has_site_search_column()
 
-        dataframe.fill_nan_with_zeros()
+        # the add_*_column methods still run on an empty dataframe, where they only add their (empty) columns so
+        # that the schema matches a non-empty result; there is nothing to fill
+        if len(dataframe) > 0:
+            dataframe.fill_nan_with_zeros()
 
         return dataframe
 
 
-    def urlinspection_dict(self, url: str, inspection_index: int = None) -> dict:
-        _now = datetime.datetime.utcnow()
+    def urlinspection_dict(self, url: str, inspection_index: int = None,
+                           now: Optional[datetime.datetime] = None) -> dict:
+        """
+        @param now: the record timestamp, by default the current UTC time
+        """
+        _now = now or datetime.datetime.now(datetime.timezone.utc)
         _d = {"record_date": _now.date(),
               "record_time": _now.time(),
               "url": url}
@@ -1030,7 +1618,8 @@ class GoogalyticsWrapper:
         if _indexStatusResult is not None:
             _last_crawl_time = _indexStatusResult.get("lastCrawlTime")
             if _last_crawl_time is not None:
-                _last_crawl_time = datetime.datetime.strptime(_last_crawl_time, "%Y-%m-%dT%H:%M:%SZ")
+                # e.g. "2023-01-31T12:34:56Z", kept as a naive (UTC) datetime
+                _last_crawl_time = datetime.datetime.fromisoformat(_last_crawl_time.removesuffix("Z"))
             _d.update({"index_status_result_verdict": _indexStatusResult.get("verdict"),
                        "coverage_state": _indexStatusResult.get("coverageState"),
                        "robotstxt_state": _indexStatusResult.get("robotsTxtState"),
@@ -1055,24 +1644,32 @@ class GoogalyticsWrapper:
         return _d
 
     def _get_urlinspection_df(self,
-                              url_list: List[str]) -> pd.DataFrame:
+                              url_list: List[str],
+                              categorise_dimensions: bool = False) -> pd.DataFrame:
         if isinstance(url_list, str):
             url_list = [url_list]
-        pga_logger.info(f"{self.__class__.__name__}.get_urlinspection_df() :: "
-                        f"requesting url inspection for {len(url_list)} urls")
-        _frames = []
-        for _i, url in enumerate(url_list):
-            _frames.append(self.urlinspection_dict(url, inspection_index=_i))
+        pga_logger.info("%s.get_urlinspection_df() :: requesting url inspection for %d urls",
+                        self.__class__.__name__, len(url_list))
+        # each inspection is a separate API call, so they run concurrently on the shared executor
+        # (rate-limited and retried by _call_api); results keep the order of url_list
+        # one timestamp for the whole batch
+        _now = datetime.datetime.now(datetime.timezone.utc)
+        _frames = self._gather_list([functools.partial(self.urlinspection_dict, url, inspection_index=_i, now=_now)
+                                     for _i, url in enumerate(url_list)])
 
         if len(_frames) == 0:
             return pd.DataFrame()
 
-        df = pd.DataFrame(_frames)
+        # built with the fixed schema rather than inferring the columns from every dict
+        df = pd.DataFrame.from_records(_frames, columns=list(URL_INSPECTION_COLUMNS))
+        df['last_crawl_time'] = pd.to_datetime(df['last_crawl_time'])
+        if categorise_dimensions:
+            gpd.categorise_columns(df, URL_INSPECTION_CATEGORY_COLUMNS)
 
         df.rename(columns={'url': 'url_full'}, inplace=True)
 
-        df['url_parameter'] = df['url_full'].apply(general_utils.url_extract_parameter)
-        df['url'] = df['url_full'].apply(general_utils.strip_url)
-        df['url_nodomain'] = df['url_full'].apply(general_utils.url_strip_domain)
+        _url_columns = ['url_parameter', 'url', 'url_nodomain']
+        df[_url_columns] = pd.DataFrame(general_utils.url_split_many(df['url_full']),
+                                        index=df.index, columns=_url_columns)
 
         return df
@@ -14,10 +14,45 @@ from .utils import general_utils
 from .utils.ga4_parser import parse_ga4_response, parse_ga3_response
 
 
+GA_CATEGORY_COLUMNS = ('country_iso_code', 'device', 'source', 'medium', 'first_user_source', 'first_user_medium',
+                       'landing_page', 'landing_page_full', 'landing_page_parameter')
+GSC_CATEGORY_COLUMNS = ('country_iso_code', 'device', 'query',
+                        'landing_page', 'landing_page_full', 'landing_page_nodomain', 'landing_page_parameter')
+GSC_INT32_COLUMNS = ('clicks', 'impressions')
+GSC_FLOAT32_COLUMNS = ('ctr', 'position')
+
+
 def camel_to_snake(string: str):
     return general_utils.RE_C2S.sub('_', string).lower()
 
 
+def categorise_columns(df: pd.DataFrame, columns) -> None:
+    """
+    Dictionary-encode string dimensions in place.
+    Every listed string column is converted, whatever its contents, so the same columns have the same
+    dtype in every response (frames from separate calls can be concatenated or merged consistently).
+    """
+    for _c in columns:
+        if _c in df.columns and (pd.api.types.is_object_dtype(df[_c]) or pd.api.types.is_string_dtype(df[_c])):
+            df[_c] = df[_c].astype('category')
+
+
+def downcast_columns(df: pd.DataFrame, int_columns=(), float_columns=()) -> None:
+    """
+    Store count and ratio metrics as 32-bit numbers in place.
+    An integer column is only converted when all of its values fit in int32.
+    """
+    _int32 = np.iinfo(np.int32)
+    for _c in int_columns:
+        if _c in df.columns and pd.api.types.is_integer_dtype(df[_c]):
+            _s = df[_c]
+            if _s.min() >= _int32.min and _s.max() <= _int32.max:
+                df[_c] = _s.astype('int32')
+    for _c in float_columns:
+        if _c in df.columns and pd.api.types.is_float_dtype(df[_c]):
+            df[_c] = df[_c].astype('float32')
+
+
 def from_response(response: dict | RunReportResponse,
                   response_type: str = None,
                   report_index: int = 0,
@@ -238,8 +273,10 @@ class GADataFrame(pd.DataFrame):
                                                                 .replace('_', ' ')
                                                                 .replace('&amp;', '&')
                                                                 )
-                self['productName'] = self['productName'].apply(lambda s: re.sub(r"\\u[a-f\d]{4}", " ", s))
-                self['productName'] = self['productName'].apply(lambda s: re.sub(r"\s+", " ", s).strip())
+                self['productName'] = (self['productName']
+                                       .str.replace(general_utils.RE_UNICODE_ESCAPE, " ", regex=True)
+                                       .str.replace(general_utils.RE_WHITESPACE, " ", regex=True)
+                                       .str.strip())
 
             if 'landingPagePlusQueryString' in self.columns:
                 self.rename(columns={'landingPagePlusQueryString': 'landingPagePath'}, inplace=True)
@@ -291,46 +328,45 @@ class GADataFrame(pd.DataFrame):
 
             if 'date' in self.columns:
                 self.drop(
-                    self[self.date.apply(lambda _date: True if _date == '(other)' else False)].index,
+                    self[self.date == '(other)'].index,
                     inplace=True
                 )
-                self.date = pd.to_datetime(self.date, format="%Y%m%d")
-                self.date = self.date.apply(lambda date_time: datetime.datetime.date(date_time))
+                self.date = pd.to_datetime(self.date, format="%Y%m%d", cache=True).dt.date
                 self.rename(columns={'date': 'recordDate'}, inplace=True)
                 self.remove_join_dimensions('date')
                 self.add_join_dimensions('recordDate')
 
             if 'yearWeek' in self.columns:
                 self.drop(
-                    self[self.yearWeek.apply(lambda _date: True if not re.match(r'^\d{6}$', _date) else False)].index,
+                    self[~self.yearWeek.str.match(general_utils.RE_YEAR_WEEK, na=False)].index,
                     inplace=True
                 )
-                date_time_series = pd.to_datetime(self.yearWeek.apply(lambda _s: _s+'1'), format="%Y%W%w")
-                self['recordDate'] = date_time_series.apply(lambda date_time: datetime.datetime.date(date_time))
+                date_time_series = pd.to_datetime(self.yearWeek + '1', format="%Y%W%w", cache=True)
+                self['recordDate'] = date_time_series.dt.date
                 self.drop(columns='yearWeek', inplace=True)
                 self.remove_join_dimensions('yearWeek')
                 self.add_join_dimensions(['recordDate'])
 
             if 'dateHourMinute' in self.columns:
                 self.drop(
-                    self[self.dateHourMinute.apply(lambda _datetime: True if _datetime == '(other)' else False)].index,
+                    self[self.dateHourMinute == '(other)'].index,
                     inplace=True
                 )
-                date_time_series = pd.to_datetime(self.dateHourMinute, format="%Y%m%d%H%M")
-                self['recordDate'] = date_time_series.apply(lambda date_time: datetime.datetime.date(date_time))
-                self['recordTime'] = date_time_series.apply(lambda date_time: date_time.time())
+                date_time_series = pd.to_datetime(self.dateHourMinute, format="%Y%m%d%H%M", cache=True)
+                self['recordDate'] = date_time_series.dt.date
+                self['recordTime'] = date_time_series.dt.time
                 self.drop(columns='dateHourMinute', inplace=True)
                 self.remove_join_dimensions('dateHourMinute')
                 self.add_join_dimensions(['recordDate', 'recordTime'])
 
             if 'dateHour' in self.columns:
                 self.drop(
-                    self[self['dateHour'].apply(lambda _datetime: True if _datetime == '(other)' else False)].index,
+                    self[self['dateHour'] == '(other)'].index,
                     inplace=True
                 )
-                date_time_series = pd.to_datetime(self['dateHour'], format="%Y%m%d%H")
-                self['recordDate'] = date_time_series.apply(lambda date_time: datetime.datetime.date(date_time))
-                self['recordTime'] = date_time_series.apply(lambda date_time: date_time.time())
+                date_time_series = pd.to_datetime(self['dateHour'], format="%Y%m%d%H", cache=True)
+                self['recordDate'] = date_time_series.dt.date
+                self['recordTime'] = date_time_series.dt.time
                 self.drop(columns='dateHour', inplace=True)
                 self.remove_join_dimensions('dateHour')
                 self.add_join_dimensions(['recordDate', 'recordTime'])
@@ -528,6 +564,13 @@ class GADataFrame(pd.DataFrame):
         for _d in dimensions:
             self.join_dimensions = remove_list_item(self.join_dimensions, _d)
 
+    def categorise_dimensions(self):
+        """
+        Opt-in: dictionary-encode the repeated string dimensions (see GA_CATEGORY_COLUMNS) in place.
+        Note that `groupby` on categorical columns includes unobserved combinations unless `observed=True`.
+        """
+        categorise_columns(self, GA_CATEGORY_COLUMNS)
+
     def fill_nan_with_zeros(self):
         values = {_col: 0 for _col, _type in self.dtypes.items() if _type == 'float' or _type == 'int'}
         self.fillna(value=values, inplace=True)
@@ -572,6 +615,56 @@ class GADataFrame(pd.DataFrame):
 
         return _out
 
+    @classmethod
+    def multi_join_on_dimensions(cls, frames: list, how: str = "outer"):
+        """
+        Join any number of GADataFrames on their join_dimensions in a single pass: each frame's
+        metric columns are aligned on the dimension index and concatenated side by side, rather
+        than merging pairwise (which re-copies the growing result for every frame).
+        Falls back to chaining `join_on_dimensions` if the dimension keys are not unique within
+        a frame or two frames share a non-dimension column, where pd.merge semantics differ.
+        @param frames: list of GADataFrames with the same join_dimensions
+        @param how: 'outer' or 'inner'
+        @returns: GADataFrame
+        """
+        _first = frames[0]
+        _dims = list(_first.join_dimensions)
+        for _frame in frames[1:]:
+            if not set(_dims) == set(_frame.join_dimensions):
+                raise ValueError("Input dataframes must have same join_dimensions")
+
+        _e = next((_frame.error for _frame in frames if _frame.error), None)
+        if _e == 'empty_response':
+            _e = None
+
+        _blocks = [pd.DataFrame(_frame).set_index(_dims) for _frame in frames]
+        _columns = [_c for _block in _blocks for _c in _block.columns]
+
+        if how not in ("outer", "inner") or len(_columns) != len(set(_columns)) or \
+                not all(_block.index.is_unique for _block in _blocks):
+            _out = _first
+            for _frame in frames[1:]:
+                _out = _out.join_on_dimensions(_frame, how=how)
+            return _out
+
+        _index = _blocks[0].index
+        for _block in _blocks[1:]:
+            _index = _index.union(_block.index) if how == "outer" else _index.intersection(_block.index)
+
+        _joined = pd.concat([_block.reindex(_index) for _block in _blocks], axis=1, copy=False)
+
+        return cls(
+            df_input=_joined.reset_index(),
+            response_type=_first.response_type,
+            dimensions=list(set(_d for _frame in frames for _d in _frame.dimensions)),
+            metrics=list(set(_m for _frame in frames for _m in _frame.metrics)),
+            from_ga_response=False,
+            join_dimensions=_first.join_dimensions,
+            start_date=min(_frame.date_range.get('start') for _frame in frames),
+            end_date=max(_frame.date_range.get('end') for _frame in frames),
+            error=_e
+        )
+
     def add_row_id(self):
         self.reset_index(drop=True, inplace=True)
         self.reset_index(drop=False, inplace=True)
@@ -625,19 +718,19 @@ class GSCDataFrame(pd.DataFrame):
                 if metric in list(self.columns):
                     self.metrics.append(metric)
 
+            # split every row's 'keys' list into the dimension columns in one pass
+            _keys = pd.DataFrame(self['keys'].to_list(), index=self.index, columns=self.dimensions)
             for _i in range(len(self.dimensions) - 1, -1, -1):
-                self.insert(loc=0, column=self.dimensions[_i],
-                            value=self['keys'].apply(lambda x: x[_i])
-                            )
+                self.insert(loc=0, column=self.dimensions[_i], value=_keys[self.dimensions[_i]])
             self.drop(columns='keys', inplace=True)
 
             if 'query' in self.columns:
                 self['query'] = self['query'].apply(lambda s: s.lower())
 
             if 'page' in self.columns:
-                self['landing_page_parameter'] = self['page'].apply(general_utils.url_extract_parameter)
-                self['landing_page'] = self['page'].apply(general_utils.strip_url)
-                self['landing_page_nodomain'] = self['page'].apply(general_utils.url_strip_domain)
+                _url_columns = ['landing_page_parameter', 'landing_page', 'landing_page_nodomain']
+                self[_url_columns] = pd.DataFrame(general_utils.url_split_many(self['page']),
+                                                  index=self.index, columns=_url_columns)
                 self.rename(columns={'page': 'landing_page_full'}, inplace=True)
 
         if from_gsc_response is False and df_input is not None:
@@ -652,14 +745,23 @@ class GSCDataFrame(pd.DataFrame):
             self.device = self.device.apply(lambda s: s.lower())
 
         if 'date' in self.columns:
-            self.date = pd.to_datetime(self.date, format="%Y-%m-%d")
-            self.date = self.date.apply(lambda date_time: datetime.datetime.date(date_time))
+            self.date = pd.to_datetime(self.date, format="%Y-%m-%d", cache=True).dt.date
             self.rename(columns={'date': 'record_date'}, inplace=True)
 
         if 'country' in self.columns:
             self.country = self.country.apply(lambda _s: _s.upper())
             self.rename(columns={'country': 'country_iso_code'}, inplace=True)
 
+        if from_gsc_response is True and df_input is not None:
+            downcast_columns(self, GSC_INT32_COLUMNS, GSC_FLOAT32_COLUMNS)
+
+    def categorise_dimensions(self):
+        """
+        Opt-in: dictionary-encode the repeated string dimensions (see GSC_CATEGORY_COLUMNS) in place.
+        Note that `groupby` on categorical columns includes unobserved combinations unless `observed=True`.
+        """
+        categorise_columns(self, GSC_CATEGORY_COLUMNS)
+
     def add_question_column(self):
         if 'query' in self.columns:
             self.insert(loc=self.columns.get_loc('query') + 1,
@@ -754,8 +856,9 @@ class GSCDataFrame(pd.DataFrame):
             bins = [0, 5, 10, 20, 40, 80, np.Inf]
         _df = self.copy()
         _df['position'] = pd.cut(_df['position'], bins)
-        binned_df = _df.groupby('position').sum()[['clicks', 'impressions']]
-        binned_df.insert(loc=0, column='queries', value=_df.groupby('position').size())
+        # every bin is kept (observed=False); only the metrics are summed, so other (e.g. categorical) columns are ignored
+        binned_df = _df.groupby('position', observed=False)[['clicks', 'impressions']].sum()
+        binned_df.insert(loc=0, column='queries', value=_df.groupby('position', observed=False).size())
         if reset_index:
             return binned_df.reset_index()
         else:
@@ -871,8 +974,9 @@ def gsc_bin_by_position(df, bins: List[int] = None):
         bins = [0, 10, 20, 50, 100]
     _df = df.copy()
     _df['position'] = pd.cut(_df['position'], bins)
-    binned_df = _df.groupby('position').sum()[['clicks', 'impressions']]
-    binned_df.insert(loc=0, column='queries', value=_df.groupby('position').size())
+    # every bin is kept (observed=False); only the metrics are summed, so other (e.g. categorical) columns are ignored
+    binned_df = _df.groupby('position', observed=False)[['clicks', 'impressions']].sum()
+    binned_df.insert(loc=0, column='queries', value=_df.groupby('position', observed=False).size())
     return binned_df.reset_index()
 
 
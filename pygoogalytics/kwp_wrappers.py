@@ -16,7 +16,7 @@ from google.ads.googleads.errors import GoogleAdsException
 from google.api_core.exceptions import InternalServerError
 from google.api_core.exceptions import ResourceExhausted
 
-from . import LOCATION_ID_DICT
+from . import location_id_dict
 
 DEFAULT_LOCATIONS = "GBR"  # location defaults GBR
 DEFAULT_LANGUAGE_ID = "1000"  # language defaults to "1000" (i.e. English)
@@ -1350,7 +1350,7 @@ def _map_location_to_resource_names(client,
     for _code in location_codes:
         _code = str(_code)
         if re.match("[A-Z]{3}", _code):
-            _id = LOCATION_ID_DICT.get(_code, None)
+            _id = location_id_dict().get(_code, None)
             if _id:
                 location_ids.append(_id)
         elif re.match("[0-9]+", _code):
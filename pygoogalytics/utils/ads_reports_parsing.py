@@ -1,12 +1,18 @@
 import datetime
+import functools
+import keyword
 import re
 import operator
-from typing import Any
+from typing import Any, Iterable
 
 from google.ads.googleads.v15.services.types.google_ads_service import GoogleAdsRow
 
 import pandas as pd
 
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; frames are built with plain pandas without it
+    pa = None
 
 
 def create_google_ads_sql_query(
@@ -16,54 +22,157 @@ def create_google_ads_sql_query(
         custom_condition_expr: str | None = None,
         limit: int | None = None) -> str:
 
-    q = f"""SELECT {', '.join(dimensions)} \nFROM {resource}"""
-
-    _con_expressions = []
-
     if not conditions:
         conditions = []
+    conditions = [normalise_condition(_c) for _c in conditions]
+
+    template = _build_query_template(resource=resource,
+                                     dimensions=tuple(dimensions),
+                                     condition_shapes=tuple((_c[0], _c[1], _is_between(_c)) for _c in conditions),
+                                     custom_condition_expr=custom_condition_expr,
+                                     limit=limit)
+
+    _literals = []
     for _c in conditions:
-        _con_expressions.append(tuple_to_sql_cond(_c))
+        if _is_between(_c):
+            _literals.extend([parse_sql_input(_c[2][0]), parse_sql_input(_c[2][1])])
+        else:
+            _literals.append(parse_sql_input(_c[2]))
+
+    return template.format(*_literals)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_query_template(resource: str,
+                          dimensions: tuple[str, ...],
+                          condition_shapes: tuple[tuple[str, str, bool], ...],
+                          custom_condition_expr: str | None = None,
+                          limit: int | None = None) -> str:
+    """
+    GAQL query with each condition literal left as a positional `{}` placeholder, to be filled in per call.
+    condition_shapes holds (field, operator, is_between) for each condition.
+    """
+    q = f"SELECT {', '.join(dimensions)} FROM {resource}"
+    q = _escape_braces(q)
+
+    _con_expressions = []
+    for _field, _operator, _between in condition_shapes:
+        if _between:
+            _con_expressions.append(f"{_escape_braces(_field)} {_escape_braces(_operator)} {{}} AND {{}}")
+        else:
+            _con_expressions.append(f"{_escape_braces(_field)} {_escape_braces(_operator)} {{}}")
     if custom_condition_expr:
-         _con_expressions.append(custom_condition_expr)
+         _con_expressions.append(_escape_braces(custom_condition_expr.replace('\n', '')))
     if len(_con_expressions) > 0:
-        q += " \nWHERE " + " \nAND ".join(_con_expressions)
+        q += " WHERE " + " AND ".join(_con_expressions)
 
     if limit:
-        q += f" \nLIMIT {limit}"
+        q += f" LIMIT {limit}"
 
     return q
 
 
+def _escape_braces(s: str) -> str:
+    return s.replace('{', '{{').replace('}', '}}')
+
+
+def _is_between(c: tuple) -> bool:
+    return c[1] == 'BETWEEN' and isinstance(c[2], (tuple, list))
+
+
+# exact types returned unchanged by parse_enum, checked with a single set lookup
+_PARSE_ENUM_PASSTHROUGH = frozenset({str, float, bool, int, type(None)})
+_MISSING = object()
+
 
 def parse_enum(v):
-    if isinstance(v, (str, float, bool)) or type(v) == int:
+    if type(v) in _PARSE_ENUM_PASSTHROUGH:
         return v
-    if v is None:
+    if isinstance(v, (str, float)):
         return v
-    try:
-        _out = v._name_
-    except AttributeError:
-        if isinstance(v, int):
-            return int(v)
-        else:
-            _out = str(v)
-    return _out
+    _out = getattr(v, '_name_', _MISSING)
+    if _out is not _MISSING:
+        return _out
+    if isinstance(v, int):
+        return int(v)
+    return str(v)
 
 
 def extract_google_ads_rows(rows: list[GoogleAdsRow], dimensions: list[str]) -> list[dict]:
-    return [{_dim: parse_enum(operator.attrgetter(_dim)(r)) for _dim in dimensions} for r in rows]
+    _getters = [operator.attrgetter(_dim) for _dim in dimensions]
+    _pe = parse_enum
+    return [{_dim: _pe(_g(r)) for _dim, _g in zip(dimensions, _getters)} for r in rows]
+
+
+def extract_google_ads_columns(rows: Iterable[GoogleAdsRow], dimensions: list[str]) -> dict[str, list]:
+    _extractor = _make_column_extractor(tuple(dimensions))
+    if _extractor is not None:
+        return _extractor(rows, parse_enum)
+
+    _getters = [operator.attrgetter(_dim) for _dim in dimensions]
+    _pe = parse_enum
+    _columns = [[] for _ in dimensions]
+    for r in rows:
+        for _col, _g in zip(_columns, _getters):
+            _col.append(_pe(_g(r)))
+    return {_dim: _col for _dim, _col in zip(dimensions, _columns)}
+
+
+RE_ATTRIBUTE_PATH = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*")
+
+
+@functools.lru_cache(maxsize=256)
+def normalise_metrics(metrics: tuple[str, ...]) -> tuple[str, ...]:
+    """Prefix each metric with `metrics.` unless it already has it."""
+    return tuple(m if m.startswith('metrics.') else f"metrics.{m}" for m in metrics)
+
+
+def validate_field_names(fields: list[str]) -> None:
+    """Raise ValueError unless every field is a dotted attribute path such as `segments.date`."""
+    _invalid = [_f for _f in fields if not isinstance(_f, str) or not RE_ATTRIBUTE_PATH.fullmatch(_f)]
+    if _invalid:
+        raise ValueError(f"invalid field names: {_invalid}")
+
+
+@functools.lru_cache(maxsize=64)
+def _make_column_extractor(dimensions: tuple[str, ...]):
+    """
+    Compile a row->columns function with the attribute paths of `dimensions` inlined.
+    Returns None if any dimension is not a plain dotted attribute path, in which case
+    the caller falls back to attrgetter.
+    """
+    for _dim in dimensions:
+        if not RE_ATTRIBUTE_PATH.fullmatch(_dim) or any(keyword.iskeyword(_p) for _p in _dim.split('.')):
+            return None  # attrgetter handles keyword-named fields; other names are rejected upstream
+
+    _src = ["def _extract(rows, _pe):"]
+    _src.extend(f"    _c{i} = []" for i in range(len(dimensions)))
+    _src.extend(f"    _a{i} = _c{i}.append" for i in range(len(dimensions)))
+    _src.append("    for r in rows:")
+    _src.extend(f"        _a{i}(_pe(r.{_dim}))" for i, _dim in enumerate(dimensions))
+    if len(dimensions) == 0:
+        _src.append("        pass")
+    _src.append("    return {" + ", ".join(f"{_dim!r}: _c{i}" for i, _dim in enumerate(dimensions)) + "}")
+
+    _namespace = {}
+    exec("\n".join(_src), _namespace)
+    return _namespace["_extract"]
 
 
 def parse_date(dt: datetime.date | str) -> str:
     if isinstance(dt, datetime.date):
-        return dt.strftime("%Y-%m-%d")
-    elif re.match(r'\d{4}-\d{2}-\d{2}', dt):
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+    elif _is_iso_date_prefix(dt):
         return dt
     else:
         raise ValueError("date given in incorrect format")
 
 
+def _is_iso_date_prefix(s: str) -> bool:
+    return (len(s) >= 10 and s[4] == '-' and s[7] == '-'
+            and s[:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit())
+
+
 def make_date_condition(dt: datetime.date | str) -> tuple[str, str, Any]:
     if isinstance(dt, tuple):
         return "segments.date", "BETWEEN", dt
@@ -73,13 +182,18 @@ def make_date_condition(dt: datetime.date | str) -> tuple[str, str, Any]:
 
 
 
-def tuple_to_sql_cond(c: tuple) -> str:
+def normalise_condition(c: tuple) -> tuple:
     if len(c) == 2:
         c = (c[0], '=', c[1])
+    if _is_between(c) and len(c[2]) != 2:
+        raise ValueError(f"BETWEEN condition expects 2 arguments, got {c[2]}")
+    return c
+
 
-    if c[1] == 'BETWEEN' and isinstance(c[2], (tuple, list)):
-        if len(c[2]) != 2:
-            raise ValueError(f"BETWEEN condition expects 2 arguments, got {c[2]}")
+def tuple_to_sql_cond(c: tuple) -> str:
+    c = normalise_condition(c)
+
+    if _is_between(c):
         return f"{c[0]} {c[1]} {parse_sql_input(c[2][0])} AND {parse_sql_input(c[2][1])}"
     else:
         return f"{c[0]} {c[1]} {parse_sql_input(c[2])}"
@@ -89,7 +203,7 @@ def parse_sql_input(v) -> str:
     if isinstance(v, str):
         return '"' + v + '"'
     elif isinstance(v, datetime.date):
-        return '"' + dt.strftime("%Y-%m-%d") + '"'
+        return '"' + parse_date(v) + '"'
     else:
         return v.__repr__()
     # if _c[1] == 'BETWEEN' and isinstance(_c[2], (tuple, list)):
@@ -104,3 +218,32 @@ def tidy_column_names(df: pd.DataFrame) -> pd.DataFrame:
             r = m.group(1)
         repl[c] = re.sub(r'\.', '/', r)
     return df.rename(columns=repl)
+
+
+# Arrow types for fields whose type is known up front; other fields are inferred by Arrow.
+_FIELD_TYPE_HINTS = {
+    'metrics.clicks': 'int64',
+    'metrics.impressions': 'int64',
+    'metrics.cost_micros': 'int64',
+    'metrics.average_cpc': 'float64',
+    'metrics.ctr': 'float64',
+    'metrics.conversions': 'float64',
+    'metrics.conversions_value': 'float64',
+    'metrics.all_conversions': 'float64',
+    'segments.date': 'string',
+}
+
+
+def columns_to_dataframe(columns: dict[str, list]) -> pd.DataFrame:
+    """
+    Build a DataFrame from a dict of column lists, going through a pyarrow Table when pyarrow
+    is installed so dtype inference happens in Arrow rather than per column in pandas.
+    """
+    if pa is not None:
+        try:
+            arrays = [pa.array(_values, type=_FIELD_TYPE_HINTS.get(_name)) for _name, _values in columns.items()]
+            return pa.Table.from_arrays(arrays, names=list(columns.keys())).to_pandas()
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    return pd.DataFrame(columns)
+
@@ -1,22 +1,58 @@
-import re
-
 from google.analytics.data_v1beta.types.analytics_data_api import RunReportResponse
 
-from .general_utils import dict_merge
-
-def parse_ga4_response(response: RunReportResponse):
-    dimension_headers = [_.name for _ in response.dimension_headers]
-    metric_headers = [_.name for _ in response.metric_headers]
-    if response.row_count > 0:
-        rows = [
-            (
-                {dim_k: dim_v for dim_k, dim_v in zip(dimension_headers, [_dv.value for _dv in _r.dimension_values])},
-                {met_k: float(met_v) for met_k, met_v in zip(metric_headers, [_dv.value for _dv in _r.metric_values])}
-            ) for _r in response.rows
-        ]
-        rows = [dict_merge(t[0], t[1]) for t in rows]
-    else:
-        rows = []
+from typing import Iterable, Iterator, Optional
+
+def _ga4_header_index(response: RunReportResponse, columns: Optional[Iterable[str]] = None):
+    # Resolve header positions once so each row is a single pass of direct index reads.
+    _dim_index = list(enumerate(_.name for _ in response.dimension_headers))
+    _met_index = list(enumerate(_.name for _ in response.metric_headers))
+    if columns is not None:
+        _wanted = set(columns)
+        _dim_index = [(_i, _h) for _i, _h in _dim_index if _h in _wanted]
+        _met_index = [(_i, _h) for _i, _h in _met_index if _h in _wanted]
+    return _dim_index, _met_index
+
+
+def _iter_ga4_rows(response: RunReportResponse, dim_index: list, met_index: list) -> Iterator[dict]:
+    if response.row_count == 0:
+        return
+    _float = float
+    for _r in response.rows:
+        _dv = _r.dimension_values
+        _mv = _r.metric_values
+        _row = {_h: _dv[_i].value for _i, _h in dim_index}
+        for _i, _h in met_index:
+            _row[_h] = _float(_mv[_i].value)
+        yield _row
+
+
+def parse_ga4_response_lazy(response: RunReportResponse, columns: Optional[Iterable[str]] = None) -> Iterator[dict]:
+    """
+    Iterate over the rows of a GA4 RunReportResponse without building the full response dictionary.
+
+    Rows are parsed one at a time as the iterator is consumed, so callers that filter or aggregate
+    never hold more than one parsed row in memory.
+
+    @param response: the RunReportResponse returned by the GA4 Data API
+    @param columns: optional set of dimension/metric names to read; values in other columns are skipped
+    @returns: iterator of row dicts (dimension values as str, metric values as float)
+    """
+    _dim_index, _met_index = _ga4_header_index(response, columns)
+    return _iter_ga4_rows(response, _dim_index, _met_index)
+
+
+def parse_ga4_response(response: RunReportResponse, columns: Optional[Iterable[str]] = None):
+    """
+    Parse a GA4 RunReportResponse into the standard response dictionary.
+
+    @param response: the RunReportResponse returned by the GA4 Data API
+    @param columns: optional whitelist of dimension/metric names; values in other columns are never read
+    @returns: response dictionary with one dict per row under 'rows'
+    """
+    _dim_index, _met_index = _ga4_header_index(response, columns)
+    dimension_headers = [_h for _, _h in _dim_index]
+    metric_headers = [_h for _, _h in _met_index]
+    rows = list(_iter_ga4_rows(response, _dim_index, _met_index))
 
     _quota = response.property_quota
     _quota_dict = {
@@ -82,8 +118,7 @@ def parse_ga3_response(response = None,
     metrics = [remove_ga_prefix(_) for _ in metrics]
 
     _dm = dimensions+metrics
-    _rows = [_.get('dimensions') + _.get('metrics', [dict()])[0].get('values') for _ in response_rows]
-    rows = [{_k: _v for _k, _v in zip(_dm, _row_values)} for _row_values in _rows]
+    rows = [dict(zip(_dm, _.get('dimensions') + _.get('metrics', [dict()])[0].get('values'))) for _ in response_rows]
 
     response = {
         'response_type': 'GA3',
@@ -97,4 +132,4 @@ def parse_ga3_response(response = None,
 
 
 def remove_ga_prefix(key: str) -> str:
-    return re.sub(r'^ga:', '', key)
+    return key.removeprefix('ga:')
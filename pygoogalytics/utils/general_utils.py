@@ -1,6 +1,14 @@
 import datetime
+import itertools
+import json
 import re
-from typing import List, Tuple, Optional
+import numpy as np
+from typing import Iterable, List, Tuple, Optional
+
+try:
+    import orjson  # pip install orjson
+except ImportError:
+    orjson = None
 
 
 QUESTION = r"((^what)|(^why)|(^how)|(^can )|(^do )|(^does)|(^where)|(^who(se)? )|(who'?s )|(^which)|(^when)|(^is )|(^are )|(.*\?$))"
@@ -15,6 +23,15 @@ RE_INVESTIGATION = re.compile(INVESTIGATION)
 RE_URL = re.compile(URL)
 RE_URL_PATH_CAPTURE = re.compile(URL_PATH_CAPTURE)
 RE_C2S = re.compile(r"(?<!^)(?=[A-Z])")
+RE_UNICODE_ESCAPE = re.compile(r"\\u[a-f\d]{4}")
+RE_WHITESPACE = re.compile(r"\s+")
+RE_YEAR_WEEK = re.compile(r"^\d{6}$")
+RE_DATE_COMPACT = re.compile(r"\d{8}")
+RE_DATE_ISO = re.compile(r"\d{4}-\d{2}-\d{2}")
+RE_DATE_SPACED = re.compile(r"\d{4} \d{2} \d{2}")
+RE_SC_DOMAIN = re.compile(r"sc-domain:.+")
+RE_INSUFFICIENT_PERMISSIONS = re.compile(r"user does not have sufficient permissions")
+RE_VIEW_ID_NOT_SET = re.compile(r"viewid must be set")
 
 
 def camel_to_snake(string: str):
@@ -43,35 +60,65 @@ def url_strip_domain(url: str) -> Optional[str]:
         return url
 
 
+def url_split_all(url: str) -> tuple[Optional[str], str, str]:
+    """
+    Single-pass equivalent of (url_extract_parameter(url), strip_url(url), url_strip_domain(url))
+    """
+    _path, _sep, _query = url.partition('?')
+    _parameter = _query.split('?')[0] if _sep else None
+    if _match := RE_URL_PATH_CAPTURE.match(_path):
+        _stripped = _match.group(1)
+    else:
+        _stripped = _path
+    if not _sep:
+        return _parameter, _stripped, _stripped
+    return _parameter, _stripped, url_strip_domain(url)
+
+
+def url_split_many(urls: Iterable[str]) -> list[tuple[Optional[str], str, str]]:
+    """
+    url_split_all for each url, splitting each distinct url only once
+    (a GSC page column repeats every page for each query, country and device)
+    """
+    _parts = {}
+    _out = []
+    for _url in urls:
+        if _url not in _parts:
+            _parts[_url] = url_split_all(_url)
+        _out.append(_parts[_url])
+    return _out
+
+
 def date_range_string(dates: List[datetime.date],
                       alternate_text: str = ""):
     if len(dates) == 0:
         date_range_str = alternate_text
     elif len(dates) == 1:
-        date_range_str = f"{dates[0].strftime('%Y-%m-%d')}"
+        date_range_str = f"{dates[0].isoformat()}"
     else:
         _min, _max, _days, _range = date_range(dates)
-        date_range_str = f"{_min.strftime('%Y-%m-%d')} to " \
-                         f"{_max.strftime('%Y-%m-%d')} ({100 * _range:.0f}%)"
+        date_range_str = f"{_min.isoformat()} to " \
+                         f"{_max.isoformat()} ({100 * _range:.0f}%)"
     return date_range_str
 
 
 def date_range(dates: List[datetime.date]) -> Tuple[datetime.date, datetime.date, int, float]:
-    _max = max(dates)
-    _min = min(dates)
+    _days_arr = np.asarray(dates, dtype='datetime64[D]')
+    _min = _days_arr.min().item()
+    _max = _days_arr.max().item()
 
     if _min == _max:
         return _min, _max, 1, 1
 
     _days = (_max - _min).days
-    _coverage = len(set(dates))/_days
+    _coverage = np.unique(_days_arr).size/_days
     return _min, _max, _days, _coverage
 
 
 def test_time(t: datetime.datetime, seconds: float) -> Optional[bool]:
     if not isinstance(t, datetime.datetime):
         return None
-    _diff = (datetime.datetime.now() - t).seconds
+    _diff = (datetime.datetime.now(t.tzinfo) - t).total_seconds()
     if _diff < seconds:
         return True
     else:
@@ -98,12 +145,44 @@ def expand_list(list_of_lists: list[list]) -> list:
         list_of_lists = _new_list
     return list_of_lists
 
+
+try:
+    from itertools import batched  # Python 3.12+
+except ImportError:
+    def batched(iterable: Iterable, n: int):
+        """
+        Split an iterable into tuples of length n (the last may be shorter), as itertools.batched
+        """
+        _it = iter(iterable)
+        while _batch := tuple(itertools.islice(_it, n)):
+            yield _batch
+
+
 def parse_date(d):
-    if m:=re.match(r"\d{8}", d):
-        return datetime.datetime.strptime(m.group(0), "%Y%m%d").date()
-    elif m:=re.match(r"\d{4}-\d{2}-\d{2}", d):
-        return datetime.datetime.strptime(m.group(0), "%Y-%m-%d").date()
-    elif m:=re.match(r"\d{4} \d{2} \d{2}", d):
-        return datetime.datetime.strptime(m.group(0), "%Y %m %d").date()
+    if m:=RE_DATE_COMPACT.match(d):
+        _s = m.group(0)
+        return datetime.date(int(_s[:4]), int(_s[4:6]), int(_s[6:]))
+    elif m:=RE_DATE_ISO.match(d):
+        return datetime.date.fromisoformat(m.group(0))
+    elif m:=RE_DATE_SPACED.match(d):
+        _s = m.group(0)
+        return datetime.date(int(_s[:4]), int(_s[5:7]), int(_s[8:]))
     else:
-        raise ValueError(f"Cannot parse date string '{d}'")
\ No newline at end of file
+        raise ValueError(f"Cannot parse date string '{d}'")
+
+
+def json_dumps(obj, indent: bool = False, sort_keys: bool = False) -> str:
+    """
+    Serialise obj to a JSON string, with orjson when it is installed and the standard json module otherwise.
+    Values that are not JSON types (e.g. dates, exceptions) are serialised as their str().
+    The two libraries format some values (e.g. datetimes, spacing) differently, so the output is for display only,
+    not for hashing (see response_cache_key).
+    """
+    if orjson is not None:
+        _option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            _option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            _option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=_option).decode('utf8')
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys, default=str)
@@ -1,14 +1,25 @@
+import hashlib
 import json
+import os
+import threading
 import yaml
 import re
 
-from typing import Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, TYPE_CHECKING
 
 from google.oauth2 import service_account, credentials  # pip install --upgrade google-auth
+from google.auth.exceptions import GoogleAuthError
+from google.auth.transport.requests import Request as AuthRequest
+from google_auth_httplib2 import AuthorizedHttp
 
 from googleapiclient import discovery  # pip install --upgrade google-api-python-client
+from googleapiclient.http import build_http
 from google.analytics.data_v1beta import BetaAnalyticsDataClient  # pip install google-analytics-data
-from google.ads.googleads.client import GoogleAdsClient
+
+if TYPE_CHECKING:
+    from google.ads.googleads.client import GoogleAdsClient
 
 _default_googleads_api_version = 15
 
@@ -25,12 +36,34 @@ def googleads_client_from_key_file(path: str):
     return googleads_client_from_yaml(googleads_yaml_string=googleads_yaml_string)
 
 
-def googleads_client_from_yaml(googleads_yaml_string: str) -> Tuple[GoogleAdsClient, str, dict]:
+# Parsed YAML and loaded GoogleAdsClient per googleads.yaml content, so repeated AdsClient construction
+# from the same configuration neither re-parses the YAML nor reloads the client. Keyed on a digest of the
+# YAML so the developer token and refresh token are not kept as a cache key.
+_ADS_CLIENT_CACHE: OrderedDict = OrderedDict()
+_ADS_CLIENT_CACHE_SIZE = 8
+_ADS_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def googleads_client_from_yaml(googleads_yaml_string: str) -> Tuple['GoogleAdsClient', str, dict]:
+    _cache_key = _key_digest(googleads_yaml_string)
+    with _ADS_CLIENT_CACHE_LOCK:
+        _cached = _ADS_CLIENT_CACHE.get(_cache_key)
+        if _cached is not None:
+            _ADS_CLIENT_CACHE.move_to_end(_cache_key)
+            return _cached
+
+    from google.ads.googleads.client import GoogleAdsClient
     googleads_yaml_dict = yaml.safe_load(googleads_yaml_string)
     default_customer_id = parse_ads_id(googleads_yaml_dict.get('default_customer_id', ''))
     api_version = parse_api_version(googleads_yaml_dict.get('api_version', _default_googleads_api_version))
     googleads_client = GoogleAdsClient.load_from_string(yaml_str=googleads_yaml_string, version=api_version)
-    return googleads_client, default_customer_id, googleads_yaml_dict
+    _result = (googleads_client, default_customer_id, googleads_yaml_dict)
+
+    with _ADS_CLIENT_CACHE_LOCK:
+        _ADS_CLIENT_CACHE[_cache_key] = _result
+        while len(_ADS_CLIENT_CACHE) > _ADS_CLIENT_CACHE_SIZE:
+            _ADS_CLIENT_CACHE.popitem(last=False)
+    return _result
 
 
 def parse_ads_id(customer_id: str | int) -> str:
@@ -43,7 +76,7 @@ def parse_api_version(api_version: str | int) -> str:
     if isinstance(api_version, int):
         _api_version = "v" + str(api_version)
     elif isinstance(api_version, str) and len(api_version) > 0:
-        if default_api_version[0] == 'v':
+        if api_version[0] == 'v':
             _api_version = api_version
         else:
             _api_version = "v" + api_version
@@ -52,7 +85,53 @@ def parse_api_version(api_version: str | int) -> str:
     return _api_version
 
 
-def get_analytics_resources(json_api_key: str | bytes | dict = None, key_file_path: str = None):
+# Resources built per service-account key, so repeated client construction from the same key
+# reuses the credentials and resources. Keyed on (path, mtime) for key files and on a digest of the
+# key content otherwise, so the key material itself is not kept as a cache key.
+_RESOURCE_CACHE: OrderedDict = OrderedDict()
+_RESOURCE_CACHE_SIZE = 8
+_RESOURCE_CACHE_LOCK = threading.Lock()
+
+
+def get_analytics_resources(json_api_key: str | bytes | dict = None, key_file_path: str = None, lazy: bool = False):
+    if key_file_path and not json_api_key:
+        _cache_key = ('file', os.path.abspath(key_file_path), os.path.getmtime(key_file_path), lazy)
+    else:
+        _cache_key = ('json', _key_digest(json_api_key), lazy)
+
+    with _RESOURCE_CACHE_LOCK:
+        resources = _RESOURCE_CACHE.get(_cache_key)
+        if resources is not None:
+            _RESOURCE_CACHE.move_to_end(_cache_key)
+            return resources
+
+    project_credentials = get_analytics_credentials(json_api_key=json_api_key, key_file_path=key_file_path)
+    resources = build_resources(project_credentials, lazy=lazy)
+
+    with _RESOURCE_CACHE_LOCK:
+        _RESOURCE_CACHE[_cache_key] = resources
+        while len(_RESOURCE_CACHE) > _RESOURCE_CACHE_SIZE:
+            _RESOURCE_CACHE.popitem(last=False)
+    return resources
+
+
+def _key_digest(json_api_key: str | bytes | dict | None) -> str | None:
+    if json_api_key is None:
+        return None
+    if isinstance(json_api_key, dict):
+        json_api_key = json.dumps(json_api_key, sort_keys=True)
+    if isinstance(json_api_key, str):
+        json_api_key = json_api_key.encode('utf8')
+    return hashlib.blake2b(json_api_key, digest_size=16).hexdigest()
+
+
+def get_analytics_resources_oauth(oauth_config: dict, client_id: str, client_secret: str, lazy: bool = False):
+    project_credentials = get_oauth_credentials(oauth_config=oauth_config, client_id=client_id,
+                                                client_secret=client_secret)
+    return build_resources(project_credentials, lazy=lazy)
+
+
+def get_analytics_credentials(json_api_key: str | bytes | dict = None, key_file_path: str = None):
     if key_file_path and not json_api_key:
         with open(key_file_path, 'rb') as _file:
             json_api_key = _file.read().decode('utf8')
@@ -73,14 +152,11 @@ def get_analytics_resources(json_api_key: str | bytes | dict = None, key_file_pa
     else:
         project_credentials = None
 
-    ga3_resource = build_resource("GA3", project_credentials)
-    ga4_resource = build_resource("GA4", project_credentials)
-    gsc_resource = build_resource("GSC", project_credentials)
+    return project_credentials
 
-    return ga3_resource, ga4_resource, gsc_resource
 
-def get_analytics_resources_oauth(oauth_config: dict, client_id: str, client_secret: str):
-    project_credentials = credentials.Credentials(
+def get_oauth_credentials(oauth_config: dict, client_id: str, client_secret: str):
+    return credentials.Credentials(
         token=oauth_config.get("accessToken"),
         refresh_token=oauth_config.get("refreshToken"),
         token_uri='https://oauth2.googleapis.com/token',
@@ -89,18 +165,123 @@ def get_analytics_resources_oauth(oauth_config: dict, client_id: str, client_sec
         # scopes=_analytics_project_scopes  # Scopes are not needed when using oauth
     )
 
-    ga3_resource = build_resource("GA3", project_credentials)
-    ga4_resource = build_resource("GA4", project_credentials)
-    gsc_resource = build_resource("GSC", project_credentials)
+
+def build_resources(creds=None, lazy: bool = False):
+    """returns the GA3, GA4 and GSC resources; with `lazy`, each is built on first use"""
+    if lazy:
+        return LazyResource("GA3", creds), LazyResource("GA4", creds), LazyResource("GSC", creds)
+
+    # the three builds are independent network-bound calls, so run them side by side, along with
+    # one token refresh on the shared credentials so the first call to each API does not wait on it
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _futures = [executor.submit(build_resource, _type, creds) for _type in ("GA3", "GA4", "GSC")]
+        executor.submit(refresh_credentials, creds)
+        ga3_resource, ga4_resource, gsc_resource = [_f.result() for _f in _futures]
 
     return ga3_resource, ga4_resource, gsc_resource
 
 
+_REFRESH_LOCK = threading.Lock()
+
+
+def refresh_credentials(creds) -> None:
+    """
+    Fetch an access token for `creds` if it does not hold a valid one; failures are left for the first API call.
+    The three resources share one credentials object, so this runs the token exchange once for all of them.
+    """
+    if creds is None or creds.valid:
+        return
+    with _REFRESH_LOCK:
+        if creds.valid:
+            return
+        try:
+            creds.refresh(AuthRequest())
+        except GoogleAuthError:
+            pass
+
+
+_THREAD_LOCAL = threading.local()
+
+
+def thread_http(resource):
+    """
+    Return an authorised httplib2.Http for the current thread and the credentials behind `resource`.
+    httplib2.Http is not thread-safe, so requests that may run on worker threads are executed with
+    `request.execute(http=thread_http(resource))` instead of on the resource's own connection.
+    Returns None (i.e. use the resource's own Http) if the credentials cannot be found.
+    """
+    _creds = getattr(resource, 'credentials', None)
+    if _creds is None:
+        _creds = getattr(getattr(resource, '_http', None), 'credentials', None)
+    if _creds is None:
+        return None
+
+    _https = getattr(_THREAD_LOCAL, 'https', None)
+    if _https is None:
+        _https = _THREAD_LOCAL.https = {}
+    # the credentials object is kept alongside its Http so its id cannot be reused while cached
+    _entry = _https.get(id(_creds))
+    if _entry is None:
+        _entry = _https[id(_creds)] = (_creds, AuthorizedHttp(_creds, http=build_http()))
+    return _entry[1]
+
+
+class LazyResource:
+    """
+    Stand-in for a GA3/GA4/GSC resource which defers `build_resource` until an attribute is first accessed,
+    so a client only pays for the discovery builds of the APIs it actually uses.
+    """
+    __slots__ = ('resource_type', 'credentials', '_resource', '_lock')
+
+    def __init__(self, resource_type: str, creds=None):
+        self.resource_type = resource_type
+        self.credentials = creds
+        self._resource = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_built(self) -> bool:
+        return self._resource is not None
+
+    @property
+    def resource(self):
+        if self._resource is None:
+            with self._lock:
+                if self._resource is None:
+                    # refresh the shared token before the first request, rather than once per
+                    # resource (or per worker thread) on first use
+                    refresh_credentials(self.credentials)
+                    self._resource = build_resource(self.resource_type, self.credentials)
+        return self._resource
+
+    def __getattr__(self, name):
+        if name in LazyResource.__slots__:
+            raise AttributeError(name)
+        return getattr(self.resource, name)
+
+    def __getstate__(self):
+        # the built resource is not picklable; it is rebuilt on first use after unpickling
+        return {'resource_type': self.resource_type, 'credentials': self.credentials}
+
+    def __setstate__(self, state):
+        self.__init__(state['resource_type'], state['credentials'])
+
+    def __repr__(self):
+        if self._resource is None:
+            return f"<LazyResource {self.resource_type} (not built)>"
+        return repr(self._resource)
+
+
 def build_resource(_type: str, creds: service_account.Credentials = None):
+    # static_discovery uses the discovery documents bundled with google-api-python-client,
+    # so no discovery request goes over the network and there is nothing to cache on disk.
+    # Each resource keeps its own transport on purpose: the three APIs live on different hosts, so a shared
+    # httplib2.Http would not reuse any connections, and httplib2 is not safe to share between threads
+    # (see `thread_http`). Connections are reused across clients through _RESOURCE_CACHE instead.
     if _type == "GA3":
-        return discovery.build('analyticsreporting', 'v4', credentials=creds)
+        return discovery.build('analyticsreporting', 'v4', credentials=creds, static_discovery=True)
     elif _type == "GSC":
-        return discovery.build('searchconsole', 'v1', credentials=creds)
+        return discovery.build('searchconsole', 'v1', credentials=creds, static_discovery=True)
     elif _type == "GA4":
         return BetaAnalyticsDataClient(credentials=creds)
     else:
@@ -0,0 +1,46 @@
+import datetime
+import hashlib
+import json
+
+try:
+    import diskcache  # pip install diskcache
+except ImportError:
+    diskcache = None
+
+
+# Time-to-live in seconds for cached API responses, per endpoint:
+# (date ranges ending within the last RECENT_DAYS days, older date ranges).
+# Recent data is still being processed by Google and can change; older data is final.
+RESPONSE_CACHE_TTL = {
+    'GSC': (60 * 60, 30 * 24 * 60 * 60),
+    'GA3': (15 * 60, 7 * 24 * 60 * 60),
+    'GA4': (15 * 60, 7 * 24 * 60 * 60),
+}
+RECENT_DAYS = 3
+
+
+def open_response_cache(response_cache):
+    """
+    @param response_cache: None, a directory path for a diskcache.Cache, or any object with
+    diskcache-style `get(key)` and `set(key, value, expire=seconds)` methods
+    @returns: the cache object, or None if caching is disabled
+    """
+    if response_cache is None or not isinstance(response_cache, str):
+        return response_cache
+    if diskcache is None:
+        raise ImportError("a response_cache directory requires diskcache: pip install diskcache")
+    return diskcache.Cache(response_cache)
+
+
+def response_cache_key(endpoint: str, request: dict) -> str:
+    # always the standard json module (not general_utils.json_dumps, which uses orjson when installed and
+    # formats dates differently), so a request has the same key in every environment sharing the cache
+    _digest = hashlib.sha1(json.dumps(request, sort_keys=True, default=str).encode('utf8')).hexdigest()
+    return f"{endpoint}:{_digest}"
+
+
+def response_cache_ttl(endpoint: str, end_date: datetime.date) -> int:
+    _recent_ttl, _final_ttl = RESPONSE_CACHE_TTL[endpoint]
+    if end_date >= datetime.date.today() - datetime.timedelta(days=RECENT_DAYS):
+        return _recent_ttl
+    return _final_ttl
@@ -0,0 +1,29 @@
+import datetime
+
+from pygoogalytics.utils.general_utils import date_range, date_range_string
+
+
+def test_date_range_string_single_date():
+    assert date_range_string([datetime.date(2024, 1, 1)]) == "2024-01-01"
+
+
+def test_date_range_string_identical_dates():
+    _dates = [datetime.date(2024, 1, 1), datetime.date(2024, 1, 1)]
+    assert date_range_string(_dates) == "2024-01-01 to 2024-01-01 (100%)"
+
+
+def test_date_range_string_real_dates():
+    _dates = [datetime.date(2024, 1, 3), datetime.date(2024, 1, 1), datetime.date(2024, 1, 5)]
+    assert date_range_string(_dates) == "2024-01-01 to 2024-01-05 (75%)"
+
+
+def test_date_range_returns_dates():
+    _min, _max, _days, _coverage = date_range([datetime.date(2024, 2, 1), datetime.date(2024, 1, 1)])
+    assert _min == datetime.date(2024, 1, 1)
+    assert _max == datetime.date(2024, 2, 1)
+    assert isinstance(_min, datetime.date)
+    assert _days == 31
+
+
+def test_date_range_string_empty():
+    assert date_range_string([], alternate_text="none") == "none"